@@ -1,4 +1,11 @@
+import functools
+import json
+import logging
+import logging.handlers
 import os
+import sys
+import threading
+from typing import Dict, Any
 from dotenv import load_dotenv
 
 # .env 파일이 있으면 로드
@@ -7,3 +14,85 @@ load_dotenv()
 # 위치 기본 설정 (한국 중심)
 DEFAULT_LATITUDE = float(os.getenv('DEFAULT_LATITUDE', '37.5665'))
 DEFAULT_LONGITUDE = float(os.getenv('DEFAULT_LONGITUDE', '126.9780'))
+
+# 로그 설정
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_BUFFER_CAPACITY = int(os.getenv('LOG_BUFFER_CAPACITY', '256'))
+LOG_FLUSH_INTERVAL_SEC = float(os.getenv('LOG_FLUSH_INTERVAL_SEC', '1.0'))
+LOG_FORMAT = "[%(levelname)s] %(message)s"
+
+
+@functools.lru_cache(maxsize=None)
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """설정 파일을 읽어 파싱 (읽기에 실패하면 예외를 그대로 전달하며 캐시하지 않음)"""
+    with open(config_path, "r") as f:
+        return json.load(f)
+
+
+def load_config_file() -> Dict[str, Any]:
+    """
+    CONFIG_PATH 환경 변수(기본 config.json)에 지정된 설정 파일 내용 반환
+    같은 경로의 파일은 프로세스에서 한 번만 읽고 이후에는 캐시된 값을 사용합니다.
+    반환된 딕셔너리는 공유되므로 수정하지 않아야 합니다.
+
+    Returns:
+        Dict[str, Any]: 설정 파일 내용
+
+    Raises:
+        OSError: 설정 파일을 열 수 없는 경우
+        ValueError: 설정 파일이 올바른 JSON이 아닌 경우
+    """
+    return _read_config_file(os.environ.get("CONFIG_PATH", "config.json"))
+
+
+class BufferedLogHandler(logging.handlers.MemoryHandler):
+    """
+    로그 레코드를 모아 두었다가 capacity개가 쌓이거나 flush_interval초가 지나면 한 번에 출력하는 핸들러
+    flushLevel 이상(기본 ERROR)의 레코드는 즉시 출력합니다.
+    """
+
+    def __init__(self, capacity: int, target: logging.Handler, flush_interval: float = 1.0,
+                 flushLevel: int = logging.ERROR):
+        """
+        버퍼 로그 핸들러 초기화
+
+        Args:
+            capacity: 버퍼에 모을 최대 레코드 수
+            target: 실제 출력을 담당하는 핸들러
+            flush_interval: 주기적으로 버퍼를 비우는 간격(초)
+            flushLevel: 즉시 출력할 최소 로그 레벨
+        """
+        super().__init__(capacity, flushLevel=flushLevel, target=target)
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+        self._flusher.start()
+
+    def _flush_periodically(self) -> None:
+        """flush_interval마다 버퍼에 남은 레코드 출력"""
+        while not self._closed.wait(self.flush_interval):
+            self.flush()
+
+    def close(self) -> None:
+        """주기 출력 스레드를 멈추고 남은 레코드를 출력한 뒤 닫기"""
+        self._closed.set()
+        super().close()
+
+
+def configure_logging(level: str = None) -> None:
+    """
+    애플리케이션 로그 설정
+    LOG_LEVEL 환경 변수(기본 INFO)로 레벨을 정하고, LOG_BUFFER_CAPACITY가 0보다 크면
+    표준 출력 쓰기를 버퍼링합니다.
+
+    Args:
+        level: 로그 레벨 이름 (지정하지 않으면 LOG_LEVEL 사용)
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    handler = stream_handler
+    if LOG_BUFFER_CAPACITY > 0:
+        handler = BufferedLogHandler(LOG_BUFFER_CAPACITY, stream_handler, flush_interval=LOG_FLUSH_INTERVAL_SEC)
+
+    logging.basicConfig(level=level or LOG_LEVEL, handlers=[handler], force=True)
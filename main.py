@@ -1,18 +1,31 @@
 import argparse
 import atexit
+import logging
 import signal
 import sys
+import threading
 
-# 기존 서비스 가져오기
-from services.data_generator import EmulatorDataGenerator
-from services.log_storage_manager import LogStorageManager, get_data_collection_config
+# 로그 설정은 서비스 모듈이 초기화되기 전에 적용
+from config import configure_logging
+configure_logging()
 
-# 데이터 생성기의 싱글톤 인스턴스 생성
-data_generator = EmulatorDataGenerator()
+logger = logging.getLogger(__name__)
 
-# 로그 저장 관리자 싱글톤 인스턴스 생성
-# 로그는 즉시 전송되며, 실패한 로그는 300초(5분)마다 재시도
-log_storage_manager = LogStorageManager(send_interval_seconds=300)
+# 기존 서비스 가져오기 - 데이터 생성기는 services.data_generator의 싱글톤을 그대로 사용
+# (EmulatorManager가 경로 종료 시 참조하는 인스턴스와 동일해야 함)
+from services.data_generator import data_generator
+from services.log_storage_manager import get_data_collection_config
+
+# 로그 저장 관리자 - 데이터 생성기가 로그를 저장하는 인스턴스를 그대로 사용
+# 백그라운드 전송 스레드가 대기열을 모아 일괄 전송하며, 실패한 로그는 300초(5분)마다 재시도
+log_storage_manager = data_generator.log_storage_manager
+
+# start 명령에서 종료 신호(Ctrl+C 또는 경로 주행 완료)를 기다리기 위한 이벤트
+# 에뮬레이터 매니저가 경로 주행을 마치면 같은 이벤트를 설정함
+_shutdown = data_generator.emulator_manager.shutdown_event
+
+# cleanup이 여러 경로(SIGTERM, 정상 종료, atexit)에서 호출되어도 한 번만 수행하기 위한 플래그
+_cleanup_done = threading.Event()
 
 class EmulatorCLI:
     """단일 에뮬레이터를 위한 명령줄 인터페이스"""
@@ -74,13 +87,12 @@ class EmulatorCLI:
                 print("실시간 데이터 수집이 이미 활성화되어 있습니다")
                 return True
 
-            # 먼저 카카오 API에서 경로 데이터를 가져와 설정 (추가된 부분)
-            print("[INFO] 실시간 데이터 수집 전 카카오 API 경로 데이터 설정 중...")
-            gps_log = data_generator.generate_gps_log(mdn, generate_full=True)
-            if gps_log:
-                print(f"[INFO] 카카오 API 경로 데이터 설정 성공 - {len(gps_log.cList)}개 포인트")
+            # 먼저 카카오 API 경로 데이터가 설정되어 있는지 확인 (start_emulator에서 이미 가져왔으면 재요청하지 않음)
+            logger.info("실시간 데이터 수집 전 카카오 API 경로 데이터 설정 중...")
+            if data_generator.ensure_route_loaded(mdn):
+                logger.info("카카오 API 경로 데이터 설정 성공 - %s개 포인트", len(data_generator.emulator_manager.kakao_route_points))
             else:
-                print("[WARNING] 카카오 API 경로 데이터 설정 실패 - 실시간 위치 업데이트가 제한될 수 있습니다")
+                logger.warning("카카오 API 경로 데이터 설정 실패 - 실시간 위치 업데이트가 제한될 수 있습니다")
 
             # 설정 파일에서 데이터 수집 설정 가져오기
             interval_sec, batch_size, send_interval_sec = get_data_collection_config()
@@ -113,7 +125,7 @@ class EmulatorCLI:
             return True
 
     def get_pending_logs(self, mdn: str = None):
-        """대기 중인 로그 가져오기"""
+        """대기 중인 로그 개수 확인"""
         # mdn이 제공되지 않으면 현재 MDN 사용
         if mdn is None:
             mdn = self.current_mdn
@@ -127,10 +139,10 @@ class EmulatorCLI:
             print(f"오류: MDN {mdn}에 대한 에뮬레이터가 존재하지 않습니다")
             return None
 
-        # 전송되지 않은 로그 가져오기
-        unsent_logs = data_generator.get_unsent_logs(mdn)
-        print(f"{len(unsent_logs)}개의 대기 중인 로그를 찾았습니다")
-        return unsent_logs
+        # 전송되지 않은 로그 개수만 조회 (로그 목록은 복사하지 않음)
+        pending_count = data_generator.get_unsent_log_count(mdn)
+        print(f"{pending_count}개의 대기 중인 로그를 찾았습니다")
+        return pending_count
 
     def show_emulator_status(self):
         """현재 에뮬레이터 상태 표시"""
@@ -276,13 +288,13 @@ def main():
     """메인 진입점"""
     # 애플리케이션 시작 시 백그라운드 로그 전송 스레드 시작
     log_storage_manager.start_background_sender()
-    print("[INFO] 애플리케이션 시작: 백그라운드 로그 전송 스레드가 시작되었습니다.")
+    logger.info("애플리케이션 시작: 백그라운드 로그 전송 스레드가 시작되었습니다.")
 
     args = parse_arguments()
     cli = EmulatorCLI()
 
     if args.command == "start":
-        print(f"[INFO] 에뮬레이터 자동 시작 - MDN: {args.mdn}")
+        logger.info("에뮬레이터 자동 시작 - MDN: %s", args.mdn)
         success = cli.start_emulator(
             mdn=args.mdn,
             terminal_id=f"TERM-{args.mdn[-4:]}",
@@ -292,31 +304,36 @@ def main():
             device_firmware_version="1.0.0"
         )
         if success:
-            print(f"[INFO] 에뮬레이터 자동 시작 완료 - MDN: {args.mdn}")
+            logger.info("에뮬레이터 자동 시작 완료 - MDN: %s", args.mdn)
 
             # 에뮬레이터 시작 후 자동으로 실시간 GPS 데이터 수집 시작
             cli.generate_gps_log(mdn=args.mdn, realtime=True)
-            print(f"[INFO] 실시간 GPS 데이터 수집 자동 시작 완료 - MDN: {args.mdn}")
+            logger.info("실시간 GPS 데이터 수집 자동 시작 완료 - MDN: %s", args.mdn)
 
             # 프로그램이 계속 실행되도록 유지
-            print("[INFO] 에뮬레이터가 백그라운드에서 실행 중입니다. 종료하려면 Ctrl+C를 누르세요.")
+            logger.info("에뮬레이터가 백그라운드에서 실행 중입니다. 종료하려면 Ctrl+C를 누르세요.")
+            # 종료 신호가 올 때까지 메인 스레드를 주기적으로 깨우지 않고 대기
+            # (SIGTERM은 handle_sigterm에서 처리)
+            previous_sigint_handler = signal.signal(signal.SIGINT, lambda signum, frame: _shutdown.set())
             try:
-                # 무한 루프로 프로그램 실행 유지
-                import time
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                print("\n[INFO] 사용자에 의해 프로그램이 중단되었습니다.")
-                # 에뮬레이터 중지 (이전에는 emulator(args.mdn)를 호출했지만 이제는 직접 처리)
-                print(f"에뮬레이터 {args.mdn}를 중지합니다.")
-                print("에뮬레이터는 GPS 주기정보 전송 종료 시 자동으로 중지됩니다.")
-                # 테스트 목적으로 에뮬레이터 상태 직접 변경
-                data_generator.emulator_manager.is_active = False
-                # CLI의 현재 MDN 초기화
-                if cli.current_mdn == args.mdn:
-                    cli.current_mdn = None
+                _shutdown.wait()
+            finally:
+                signal.signal(signal.SIGINT, previous_sigint_handler)
+
+            if data_generator.emulator_manager.route_finalized:
+                logger.info("경로 주행이 완료되어 프로그램을 종료합니다.")
+            else:
+                logger.info("사용자에 의해 프로그램이 중단되었습니다.")
+            # 에뮬레이터 중지 (이전에는 emulator(args.mdn)를 호출했지만 이제는 직접 처리)
+            print(f"에뮬레이터 {args.mdn}를 중지합니다.")
+            print("에뮬레이터는 GPS 주기정보 전송 종료 시 자동으로 중지됩니다.")
+            # 테스트 목적으로 에뮬레이터 상태 직접 변경
+            data_generator.emulator_manager.is_active = False
+            # CLI의 현재 MDN 초기화
+            if cli.current_mdn == args.mdn:
+                cli.current_mdn = None
         else:
-            print(f"[경고] 에뮬레이터 자동 시작 실패 - MDN: {args.mdn}")
+            logger.warning("에뮬레이터 자동 시작 실패 - MDN: %s", args.mdn)
 
     elif args.command == "start_emulator":
         cli.start_emulator(args.mdn)
@@ -353,12 +370,12 @@ def main():
 
 # SIGTERM 신호 처리 함수
 def handle_sigterm(signum, frame):
-    print("\n[INFO] SIGTERM 신호를 받았습니다. 에뮬레이터를 정상 종료합니다.")
+    logger.info("SIGTERM 신호를 받았습니다. 에뮬레이터를 정상 종료합니다.")
 
     # 현재 활성화된 모든 에뮬레이터에 대해 PowerOFF 로그 생성 및 전송
     active_mdns = list(data_generator.emulator_manager.active_emulators.keys())
     for mdn in active_mdns:
-        print(f"[INFO] 에뮬레이터 {mdn} 정상 종료 중...")
+        logger.info("에뮬레이터 %s 정상 종료 중...", mdn)
         # PowerOFF 로그 생성 및 전송
         data_generator.stop_vehicle(mdn, send_power_log=True)
 
@@ -370,6 +387,13 @@ def handle_sigterm(signum, frame):
 
 # 프로그램 종료 시 백그라운드 스레드 정리 (기존 함수 확장)
 def cleanup():
+    if _cleanup_done.is_set():
+        return
+    _cleanup_done.set()
+
+    # 종료 이벤트를 기다리는 대기 루프와 수집 스레드에 종료 알림
+    _shutdown.set()
+
     # 백그라운드 로그 전송 스레드 중지
     log_storage_manager.stop_background_sender()
 
@@ -377,7 +401,7 @@ def cleanup():
     if hasattr(data_generator.emulator_manager, 'stop_realtime_data_collection_all'):
         data_generator.emulator_manager.stop_realtime_data_collection_all()
 
-    print("[INFO] 프로그램 종료: 리소스 정리 완료")
+    logger.info("프로그램 종료: 리소스 정리 완료")
 
 # SIGTERM 신호 핸들러 등록
 signal.signal(signal.SIGTERM, handle_sigterm)
@@ -387,8 +411,11 @@ atexit.register(cleanup)
 
 if __name__ == "__main__":
     try:
-        sys.exit(main())
+        exit_code = main()
     except KeyboardInterrupt:
-        print("\n[INFO] 사용자에 의해 프로그램이 중단되었습니다.")
+        logger.info("사용자에 의해 프로그램이 중단되었습니다.")
+        exit_code = 0
+    finally:
+        # 수집 스레드는 데몬 스레드가 아니므로 예외로 빠져나가는 경우에도 인터프리터 종료(atexit) 전에 먼저 정리
         cleanup()
-        sys.exit(0)
+    sys.exit(exit_code)
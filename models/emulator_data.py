@@ -73,4 +73,4 @@ class VehicleData(BaseModel):
     heading: Optional[int] = None
     battery_level: Optional[float] = None
     engine_temperature: Optional[float] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
@@ -0,0 +1,135 @@
+"""
+GPS 수집 데이터 버퍼
+실시간으로 수집한 GPS 포인트를 항목별 배열(SoA)로 보관합니다.
+포인트마다 dict를 만들지 않고 float 배열에 값을 쌓은 뒤, 전송 시점에만 로그 항목으로 변환합니다.
+"""
+
+import math
+from array import array
+from datetime import datetime
+from typing import Dict, Any, Iterable, Iterator
+
+
+class GpsSampleBuffer:
+    """
+    GPS 포인트를 항목별 배열로 보관하는 버퍼
+    기존 코드와의 호환을 위해 인덱스/반복 접근 시에는 포인트 dict를 만들어 반환합니다.
+    용량을 지정하면 배열을 미리 할당해 두고 앞에서부터 채우므로, 열 배열을 직접 읽기 전에는 trim()을 호출해야 합니다.
+    """
+
+    __slots__ = ("timestamps", "latitudes", "longitudes", "speeds", "angles", "batteries", "size")
+
+    def __init__(self, capacity: int = 0):
+        """
+        버퍼 생성
+
+        Args:
+            capacity: 미리 할당할 포인트 수 (배치 크기, 초과 시 배열이 자동으로 늘어남)
+        """
+        zeros = bytes(8 * capacity)
+        # 타임스탬프는 epoch 초 (없으면 NaN)
+        self.timestamps = array("d", zeros)
+        self.latitudes = array("d", zeros)
+        self.longitudes = array("d", zeros)
+        self.speeds = array("d", zeros)
+        self.angles = array("d", zeros)
+        self.batteries = array("d", zeros)
+        # 실제로 채워진 포인트 수
+        self.size = 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "GpsSampleBuffer":
+        """
+        포인트 dict 목록으로 버퍼 생성
+
+        Args:
+            records: {"timestamp", "latitude", "longitude", "speed", "angle", "battery"} 형식의 포인트 목록
+
+        Returns:
+            GpsSampleBuffer: 생성된 버퍼
+        """
+        buffer = cls()
+        for record in records:
+            timestamp = record.get("timestamp")
+            buffer.append(
+                timestamp.timestamp() if timestamp else math.nan,
+                record.get("latitude", 0),
+                record.get("longitude", 0),
+                record.get("speed", 0),
+                record.get("angle", 0),
+                record.get("battery", 0)
+            )
+        return buffer
+
+    def append(self, timestamp: float, latitude: float, longitude: float,
+               speed: float, angle: float, battery: float) -> None:
+        """
+        포인트 추가
+
+        Args:
+            timestamp: 수집 시각 (epoch 초)
+            latitude: 위도
+            longitude: 경도
+            speed: 속도 (km/h)
+            angle: 방향각
+            battery: 배터리 레벨
+        """
+        index = self.size
+        if index < len(self.latitudes):
+            # 미리 할당된 자리에 기록
+            self.timestamps[index] = timestamp
+            self.latitudes[index] = latitude
+            self.longitudes[index] = longitude
+            self.speeds[index] = speed
+            self.angles[index] = angle
+            self.batteries[index] = battery
+        else:
+            self.timestamps.append(timestamp)
+            self.latitudes.append(latitude)
+            self.longitudes.append(longitude)
+            self.speeds.append(speed)
+            self.angles.append(angle)
+            self.batteries.append(battery)
+        self.size = index + 1
+
+    def trim(self) -> "GpsSampleBuffer":
+        """
+        채워지지 않은 미리 할당분을 잘라내 열 배열 길이를 포인트 수에 맞춤
+
+        Returns:
+            GpsSampleBuffer: 자기 자신
+        """
+        size = self.size
+        if len(self.latitudes) != size:
+            for column in (self.timestamps, self.latitudes, self.longitudes, self.speeds, self.angles, self.batteries):
+                del column[size:]
+        return self
+
+    def clear(self) -> None:
+        """모든 포인트 삭제"""
+        for column in (self.timestamps, self.latitudes, self.longitudes, self.speeds, self.angles, self.batteries):
+            del column[:]
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """인덱스 위치의 포인트를 dict로 반환 (음수 인덱스 지원)"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("GpsSampleBuffer index out of range")
+        timestamp = self.timestamps[index]
+        return {
+            "timestamp": None if math.isnan(timestamp) else datetime.fromtimestamp(timestamp),
+            "latitude": self.latitudes[index],
+            "longitude": self.longitudes[index],
+            "speed": self.speeds[index],
+            "angle": self.angles[index],
+            "battery": self.batteries[index],
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self[index]
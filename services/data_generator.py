@@ -2,24 +2,40 @@
 데이터 생성기 파사드 클래스
 로그 타입별 생성기 클래스를 통합 관리하는 파사드 패턴 구현
 """
-import sys
+import logging
 import threading
-import queue
-from typing import List, Dict, Any, Optional
+from itertools import chain, islice
+from typing import List, Dict, Any, Iterator, Optional, Union
 
-from models.emulator_data import VehicleData, GpsLogRequest, PowerLogRequest, GeofenceLogRequest
+from models.emulator_data import GpsLogRequest, PowerLogRequest, GeofenceLogRequest
+from models.gps_sample_buffer import GpsSampleBuffer
 from services.emulator_manager import EmulatorManager
 from services.log_storage_manager import LogStorageManager
 from services.log_generators.gps_log_generator import GpsLogGenerator
 from services.log_generators.power_log_generator import PowerLogGenerator
 from services.log_generators.geofence_log_generator import GeofenceLogGenerator
 
+logger = logging.getLogger(__name__)
+
+# 성공/실패에 따라 고르는 로그 메시지 (호출마다 조건식으로 문자열을 조합하지 않음)
+_POWER_OFF_STORE_OK = "차량 %s 시동 OFF 로그 생성 및 저장 성공"
+_POWER_OFF_STORE_FAIL = "차량 %s 시동 OFF 로그 생성 및 저장 실패"
+_STOP_VEHICLE_OK = "시동 종료 성공 - MDN: %s"
+_STOP_VEHICLE_FAIL = "시동 종료 실패 - MDN: %s"
+
+
 class EmulatorDataGenerator:
     """
     에뮬레이터 데이터 생성 파사드 클래스
     각 로그 타입별 생성기를 관리하고 필요한 작업을 위임합니다.
     """
 
+    __slots__ = (
+        "emulator_manager", "log_storage_manager",
+        "gps_generator", "power_generator", "geofence_generator",
+        "create_gps_log_from_batch", "store_gps_log_direct"
+    )
+
     def __init__(self):
         """에뮬레이터 데이터 생성기 초기화"""
         # 에뮬레이터 관리자
@@ -33,12 +49,11 @@ class EmulatorDataGenerator:
         self.power_generator = PowerLogGenerator(self.emulator_manager)
         self.geofence_generator = GeofenceLogGenerator(self.emulator_manager)
 
-        # 데이터 생성 상태
-        self.is_generating = {}
-        self.generate_threads = {}
-        self.stop_events = {}
+        # 실시간 수집 콜백에서 매 배치마다 사용하는 메서드 (속성 체인 조회 생략)
+        self.create_gps_log_from_batch = self.gps_generator.create_gps_log_from_collected_data
+        self.store_gps_log_direct = self.log_storage_manager.gps_handler.store_gps_log
 
-        print("[INFO] 에뮬레이터 데이터 생성기 초기화 완료")
+        logger.info("에뮬레이터 데이터 생성기 초기화 완료")
 
     #
     # GPS 로그 관련 메서드
@@ -55,8 +70,35 @@ class EmulatorDataGenerator:
         Returns:
             Optional[GpsLogRequest]: 생성된 GPS 로그
         """
+        # 비활성 에뮬레이터는 생성기를 거치지 않고 바로 반환
+        if not self.emulator_manager.is_emulator_active(mdn):
+            return None
         return self.gps_generator.generate_gps_log(mdn, generate_full)
 
+    def ensure_route_loaded(self, mdn: str) -> bool:
+        """
+        카카오 API 경로 데이터가 에뮬레이터에 설정되어 있는지 확인하고, 없으면 가져와 설정
+        아직 주행 중인 경로가 있으면 네트워크 요청이나 GPS 로그 생성 없이 바로 반환하고,
+        끝까지 주행한 경로는 같은 포인트로 다시 설정하여 첫 포인트부터 주행합니다.
+
+        Args:
+            mdn: 차량 번호(MDN)
+
+        Returns:
+            bool: 경로 데이터 설정 여부
+        """
+        if not self.emulator_manager.is_emulator_active(mdn):
+            return False
+
+        manager = self.emulator_manager
+        if manager.kakao_route_points:
+            if manager.current_route_index < manager.route_length and not manager.route_finalized:
+                return True
+            # 이전 주행에서 소진된 경로 - 인덱스/종료 상태/위치를 첫 포인트로 초기화
+            return manager.set_kakao_route_data(manager.kakao_route_points)
+
+        return self.gps_generator.load_kakao_route(mdn)
+
     def store_gps_log(self, mdn: str, log_data: GpsLogRequest) -> bool:
         """
         GPS 로그 저장 (LogStorageManager에 위임)
@@ -106,6 +148,9 @@ class EmulatorDataGenerator:
         Returns:
             Optional[PowerLogRequest]: 생성된 시동 로그
         """
+        # 비활성 에뮬레이터는 생성기를 거치지 않고 바로 반환
+        if not self.emulator_manager.is_emulator_active(mdn):
+            return None
         return self.power_generator.generate_power_log(mdn, power_on)
 
     def store_power_log(self, mdn: str, log_data: PowerLogRequest) -> bool:
@@ -139,6 +184,9 @@ class EmulatorDataGenerator:
         Returns:
             Optional[GeofenceLogRequest]: 생성된 지오펜스 로그
         """
+        # 비활성 에뮬레이터는 생성기를 거치지 않고 바로 반환
+        if not self.emulator_manager.is_emulator_active(mdn):
+            return None
         return self.geofence_generator.generate_geofence_log(mdn, geo_grp_id, geo_p_id, evt_val)
 
     def store_geofence_log(self, mdn: str, log_data: GeofenceLogRequest) -> bool:
@@ -170,7 +218,7 @@ class EmulatorDataGenerator:
         """
         # 에뮬레이터 존재 여부 확인
         if not self.emulator_manager.is_emulator_exists(log_data.mdn):
-            print(f"[ERROR] 존재하지 않는 에뮬레이터입니다: {log_data.mdn}")
+            logger.error("존재하지 않는 에뮬레이터입니다: %s", log_data.mdn)
             return False
 
         # GPS 로그 저장
@@ -188,30 +236,59 @@ class EmulatorDataGenerator:
         """
         # 에뮬레이터 존재 여부 확인
         if not self.emulator_manager.is_emulator_exists(log_data.mdn):
-            print(f"[ERROR] 존재하지 않는 에뮬레이터입니다: {log_data.mdn}")
+            logger.error("존재하지 않는 에뮬레이터입니다: %s", log_data.mdn)
             return False
 
         # 시동 로그 저장
         return self.store_power_log(log_data.mdn, log_data)
 
-    def get_unsent_logs(self, mdn: str) -> list:
+    def get_unsent_logs(self, mdn: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
         """
-        특정 MDN에 대한 미전송 로그 목록 조회
+        특정 MDN에 대한 미전송 로그 조회
+        핸들러별 목록을 하나로 합친 새 리스트를 만들지 않고 차례로 순회하는 이터레이터를 반환합니다.
 
         Args:
             mdn: 차량 번호(MDN)
+            limit: 반환할 최대 로그 수 (None이면 전체)
 
         Returns:
-            list: 미전송 로그 목록
+            Iterator[Dict[str, Any]]: 미전송 로그 이터레이터 (GPS, 시동, 지오펜스 순)
         """
         # 각 핸들러에서 미전송 로그 수집
-        gps_logs = self.log_storage_manager.gps_handler.get_pending_logs(mdn)
-        power_logs = self.log_storage_manager.power_handler.get_pending_logs(mdn)
-        geofence_logs = self.log_storage_manager.geofence_handler.get_pending_logs(mdn)
+        gps_logs = self.log_storage_manager.gps_handler.get_pending_logs(mdn, limit)
+        power_logs = self.log_storage_manager.power_handler.get_pending_logs(mdn, limit)
+        geofence_logs = self.log_storage_manager.geofence_handler.get_pending_logs(mdn, limit)
+
+        # 모든 로그를 이어서 순회
+        all_logs = chain(gps_logs, power_logs, geofence_logs)
+        return all_logs if limit is None else islice(all_logs, limit)
+
+    def get_unsent_logs_list(self, mdn: str, limit: Optional[int] = None) -> list:
+        """
+        특정 MDN에 대한 미전송 로그 목록 조회 (길이나 인덱스가 필요한 호출자용)
 
-        # 모든 로그 합치기
-        all_logs = gps_logs + power_logs + geofence_logs
-        return all_logs
+        Args:
+            mdn: 차량 번호(MDN)
+            limit: 반환할 최대 로그 수 (None이면 전체)
+
+        Returns:
+            list: 미전송 로그 목록
+        """
+        return list(self.get_unsent_logs(mdn, limit))
+
+    def get_unsent_log_count(self, mdn: str) -> int:
+        """
+        특정 MDN에 대한 미전송 로그 개수 조회 (로그 목록을 복사하지 않음)
+
+        Args:
+            mdn: 차량 번호(MDN)
+
+        Returns:
+            int: 미전송 로그 개수
+        """
+        return (self.log_storage_manager.gps_handler.count_pending_logs(mdn)
+                + self.log_storage_manager.power_handler.count_pending_logs(mdn)
+                + self.log_storage_manager.geofence_handler.count_pending_logs(mdn))
 
     #
     # 에뮬레이터 제어 메서드
@@ -231,17 +308,15 @@ class EmulatorDataGenerator:
         if not self.emulator_manager.is_emulator_active(mdn):
             return False
 
-        # 차량 활성화 - 단일 에뮬레이터 모드에서는 직접 속성 설정
-        self.emulator_manager.is_active = True
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.emulator_manager.active_emulators = {mdn: self.emulator_manager.get_emulator_dict()}
+        # 차량 활성화
+        self.emulator_manager.set_active(mdn, True)
 
         # 시동 ON 로그 생성 및 전송
         if send_power_log:
             power_log = self.generate_power_log(mdn, power_on=True)
             if power_log:
                 self.store_power_log(mdn, power_log)
-                print(f"[INFO] 차량 {mdn} 시동 ON 로그 생성 및 저장 완료")
+                logger.info("차량 %s 시동 ON 로그 생성 및 저장 완료", mdn)
 
         return True
 
@@ -256,47 +331,41 @@ class EmulatorDataGenerator:
         Returns:
             bool: 성공 여부
         """
-        print(f"[DEBUG] stop_vehicle 호출됨 - MDN: {mdn}, send_power_log: {send_power_log}")
+        logger.debug("stop_vehicle 호출됨 - MDN: %s, send_power_log: %s", mdn, send_power_log)
 
         if not self.emulator_manager.is_emulator_active(mdn):
-            print(f"[WARNING] 에뮬레이터가 활성화되지 않았습니다 - MDN: {mdn}")
+            logger.warning("에뮬레이터가 활성화되지 않았습니다 - MDN: %s", mdn)
             return False
 
         # 시동 OFF 로그 생성 및 전송 (차량 비활성화 전에 수행)
         if send_power_log:
-            print(f"[DEBUG] 시동 OFF 로그 생성 시작 - MDN: {mdn}")
+            logger.debug("시동 OFF 로그 생성 시작 - MDN: %s", mdn)
             power_log = self.generate_power_log(mdn, power_on=False)
             if power_log:
-                print(f"[DEBUG] 시동 OFF 로그 생성 완료 - MDN: {mdn}, onTime: {power_log.onTime}, offTime: {power_log.offTime}")
+                logger.debug("시동 OFF 로그 생성 완료 - MDN: %s, onTime: %s, offTime: %s", mdn, power_log.onTime, power_log.offTime)
                 store_result = self.store_power_log(mdn, power_log)
-                print(f"[INFO] 차량 {mdn} 시동 OFF 로그 생성 및 저장 {'성공' if store_result else '실패'}")
+                logger.info(_POWER_OFF_STORE_OK if store_result else _POWER_OFF_STORE_FAIL, mdn)
 
                 # 시동 OFF 로그 전송을 위해 대기 로그 처리
-                print(f"[INFO] 시동 OFF 로그 전송을 위해 잠시 대기합니다 - MDN: {mdn}")
-                # 백엔드 전송 대기 로그 개수 확인
-                pending_logs = self.log_storage_manager.count_pending_logs()
+                logger.info("시동 OFF 로그 전송을 위해 잠시 대기합니다 - MDN: %s", mdn)
+                # 미전송 로그 일괄 전송 (시동 OFF 로그 전송 시도) 및 전송 전/후 개수 확인
+                pending_logs, after_pending = self.log_storage_manager.flush_pending()
                 total_pending = sum(pending_logs.values())
-                print(f"[DEBUG] 현재 백엔드 전송 대기 로그 개수: 총 {total_pending}개 (GPS: {pending_logs['gps']}, 전원: {pending_logs['power']}, 지오펜스: {pending_logs['geofence']}) - MDN: {mdn}")
+                logger.debug("현재 백엔드 전송 대기 로그 개수: 총 %s개 (GPS: %s, 전원: %s, 지오펜스: %s) - MDN: %s", total_pending, pending_logs['gps'], pending_logs['power'], pending_logs['geofence'], mdn)
 
-                # 미전송 로그 처리 (시동 OFF 로그 전송 시도)
                 if total_pending > 0:
-                    self.log_storage_manager.process_pending_logs()
-
                     # 처리 후 남은 로그 확인
-                    after_pending = self.log_storage_manager.count_pending_logs()
                     after_total = sum(after_pending.values())
                     if after_total < total_pending:
-                        print(f"[SUCCESS] {total_pending - after_total}개의 로그가 성공적으로 전송됨")
+                        logger.info("%s개의 로그가 성공적으로 전송됨", total_pending - after_total)
                     else:
-                        print(f"[WARNING] 모든 로그 전송 실패 또는 새 로그 추가됨")
+                        logger.warning("모든 로그 전송 실패 또는 새 로그 추가됨")
             else:
-                print(f"[ERROR] 시동 OFF 로그 생성 실패 - MDN: {mdn}")
+                logger.error("시동 OFF 로그 생성 실패 - MDN: %s", mdn)
 
-        # 차량 비활성화 - 단일 에뮬레이터 모드에서는 직접 속성 설정
-        self.emulator_manager.is_active = False
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.emulator_manager.active_emulators = {mdn: self.emulator_manager.get_emulator_dict()}
-        print(f"[DEBUG] 차량 비활성화 완료 - MDN: {mdn}")
+        # 차량 비활성화
+        self.emulator_manager.set_active(mdn, False)
+        logger.debug("차량 비활성화 완료 - MDN: %s", mdn)
 
         return True
 
@@ -327,84 +396,23 @@ class EmulatorDataGenerator:
         )
 
         if not success:
-            print(f"[ERROR] 에뮬레이터 {mdn} 등록 실패")
+            logger.error("에뮬레이터 %s 등록 실패", mdn)
             return False
 
-        print(f"[INFO] 에뮬레이터 {mdn} 등록 완료")
+        logger.info("에뮬레이터 %s 등록 완료", mdn)
 
         # 카카오 API에서 경로 데이터를 가져와 에뮬레이터 위치 업데이트
-        print(f"[INFO] 카카오 API 경로 데이터 가져오기 시작 - MDN: {mdn}")
-        gps_log = self.gps_generator.generate_gps_log(mdn, generate_full=True)
-        if gps_log:
-            print(f"[INFO] 카카오 API 경로 데이터 가져오기 성공 - MDN: {mdn}")
+        logger.info("카카오 API 경로 데이터 가져오기 시작 - MDN: %s", mdn)
+        if self.ensure_route_loaded(mdn):
+            logger.info("카카오 API 경로 데이터 가져오기 성공 - MDN: %s", mdn)
         else:
-            print(f"[WARNING] 카카오 API 경로 데이터 가져오기 실패 - MDN: {mdn}")
+            logger.warning("카카오 API 경로 데이터 가져오기 실패 - MDN: %s", mdn)
 
         # 차량 시동 시작 (위치가 업데이트된 후에 시동 ON 로그 생성)
         self.start_vehicle(mdn)
 
         return True
 
-
-    #
-    # 로그 처리 메서드
-    #
-
-    def process_gps_log(self, log_data: GpsLogRequest) -> bool:
-        """
-        수신된 GPS 로그 데이터 처리
-
-        Args:
-            log_data: GPS 로그 요청 데이터
-
-        Returns:
-            bool: 처리 성공 여부
-        """
-        # 에뮬레이터 존재 여부 확인
-        if not self.emulator_manager.is_emulator_exists(log_data.mdn):
-            print(f"[ERROR] 존재하지 않는 에뮬레이터입니다: {log_data.mdn}")
-            return False
-
-        # GPS 로그 저장
-        return self.store_gps_log(log_data.mdn, log_data)
-
-    def process_power_log(self, log_data: PowerLogRequest) -> bool:
-        """
-        수신된 시동 로그 데이터 처리
-
-        Args:
-            log_data: 시동 로그 요청 데이터
-
-        Returns:
-            bool: 처리 성공 여부
-        """
-        # 에뮬레이터 존재 여부 확인
-        if not self.emulator_manager.is_emulator_exists(log_data.mdn):
-            print(f"[ERROR] 존재하지 않는 에뮬레이터입니다: {log_data.mdn}")
-            return False
-
-        # 시동 로그 저장
-        return self.store_power_log(log_data.mdn, log_data)
-
-    def get_unsent_logs(self, mdn: str) -> list:
-        """
-        특정 MDN에 대한 미전송 로그 목록 조회
-
-        Args:
-            mdn: 차량 번호(MDN)
-
-        Returns:
-            list: 미전송 로그 목록
-        """
-        # 각 핸들러에서 미전송 로그 수집
-        gps_logs = self.log_storage_manager.gps_handler.get_pending_logs(mdn)
-        power_logs = self.log_storage_manager.power_handler.get_pending_logs(mdn)
-        geofence_logs = self.log_storage_manager.geofence_handler.get_pending_logs(mdn)
-
-        # 모든 로그 합치기
-        all_logs = gps_logs + power_logs + geofence_logs
-        return all_logs
-
     #
     # 미전송 로그 관련 메서드 (후방 호환성 유지)
     #
@@ -484,38 +492,38 @@ class EmulatorDataGenerator:
         """
         return self.log_storage_manager.stop_background_sender()
 
-    def _process_collected_data(self, mdn: str, data_batch: List[Dict[str, Any]], store: bool = True) -> Optional[GpsLogRequest]:
+    def _process_collected_data(self, mdn: str, data_batch: Union[GpsSampleBuffer, List[Dict[str, Any]]], store: bool = True) -> Optional[GpsLogRequest]:
         """
         실시간 데이터 수집 콜백 메서드
         EmulatorManager의 실시간 데이터 수집에서 호출되는 콜백 함수
 
         Args:
             mdn: 차량 번호(MDN)
-            data_batch: 수집된 데이터 배치 (60초 또는 설정된 배치 크기만큼의 데이터)
+            data_batch: 수집된 데이터 배치 (60초 또는 설정된 배치 크기만큼의 GpsSampleBuffer)
             store: 생성된 로그를 저장소에 저장할지 여부
 
         Returns:
             Optional[GpsLogRequest]: 생성된 GPS 로그
         """
-        if not data_batch or len(data_batch) == 0:
-            print(f"[WARNING] 차량 {mdn}의 수집 데이터가 없습니다")
+        if not data_batch:
+            logger.warning("차량 %s의 수집 데이터가 없습니다", mdn)
             return None
 
-        print(f"[INFO] 차량 {mdn}의 {len(data_batch)}개 데이터 처리 중")
+        logger.info("차량 %s의 %s개 데이터 처리 중", mdn, len(data_batch))
 
         # GPS 로그 생성 (기존 create_gps_log_from_collected_data 메서드 사용)
-        gps_log = self.gps_generator.create_gps_log_from_collected_data(mdn, data_batch)
+        gps_log = self.create_gps_log_from_batch(mdn, data_batch)
         if not gps_log:
-            print(f"[ERROR] 차량 {mdn} GPS 로그 생성 실패")
+            logger.error("차량 %s GPS 로그 생성 실패", mdn)
             return None
 
         # 로그 저장
         if store:
-            self.store_gps_log(mdn, gps_log)
-            print(f"[INFO] 차량 {mdn} GPS 로그 저장 완료")
+            self.store_gps_log_direct(mdn, gps_log)
+            logger.info("차량 %s GPS 로그 저장 완료", mdn)
 
             # GPS 주기정보 전송 종료 후 처리 로직 (이전에 stop_emulator에서 처리하던 로직)
-            print(f"[INFO] GPS 주기정보 전송 종료 후 처리 시작 - MDN: {mdn}")
+            logger.info("GPS 주기정보 전송 종료 후 처리 시작 - MDN: %s", mdn)
 
             # 모든 경로 포인트가 처리되었는지 확인
             has_route_data = self.emulator_manager.kakao_route_points and len(self.emulator_manager.kakao_route_points) > 0
@@ -523,49 +531,82 @@ class EmulatorDataGenerator:
 
             # 차량 시동 종료 - 모든 경로 포인트가 처리된 경우에만 수행
             if all_points_processed and self.emulator_manager.is_emulator_active(mdn):
-                print(f"[DEBUG] 모든 경로 포인트 처리 완료 - 시동 종료 시작 - MDN: {mdn}")
+                logger.debug("모든 경로 포인트 처리 완료 - 시동 종료 시작 - MDN: %s", mdn)
                 stop_vehicle_result = self.stop_vehicle(mdn)
-                print(f"[DEBUG] 시동 종료 {'성공' if stop_vehicle_result else '실패'} - MDN: {mdn}")
+                logger.debug(_STOP_VEHICLE_OK if stop_vehicle_result else _STOP_VEHICLE_FAIL, mdn)
             elif not all_points_processed:
-                print(f"[INFO] 아직 모든 경로 포인트가 처리되지 않았습니다. 시동 종료를 건너뜁니다 - MDN: {mdn}")
-                print(f"[DEBUG] 현재 경로 인덱스: {self.emulator_manager.current_route_index}, 전체 포인트 수: {len(self.emulator_manager.kakao_route_points) if has_route_data else 0}")
+                logger.info("아직 모든 경로 포인트가 처리되지 않았습니다. 시동 종료를 건너뜁니다 - MDN: %s", mdn)
+                logger.debug("현재 경로 인덱스: %s, 전체 포인트 수: %s", self.emulator_manager.current_route_index, len(self.emulator_manager.kakao_route_points) if has_route_data else 0)
             else:
-                print(f"[WARNING] 에뮬레이터가 이미 비활성화 상태입니다 - MDN: {mdn}")
+                logger.warning("에뮬레이터가 이미 비활성화 상태입니다 - MDN: %s", mdn)
 
             # 에뮬레이터 비활성화 - 모든 경로 포인트가 처리된 경우에만 수행
             if all_points_processed:
-                print(f"[DEBUG] 에뮬레이터 비활성화 시작 - MDN: {mdn}")
+                logger.debug("에뮬레이터 비활성화 시작 - MDN: %s", mdn)
                 success = self.emulator_manager.stop_emulator(mdn)
 
                 if not success:
-                    print(f"[ERROR] 에뮬레이터 {mdn} 비활성화 실패")
+                    logger.error("에뮬레이터 %s 비활성화 실패", mdn)
                 else:
-                    print(f"[INFO] 에뮬레이터 {mdn} 비활성화 완료")
+                    logger.info("에뮬레이터 %s 비활성화 완료", mdn)
 
-            # 백엔드 전송 대기 로그 개수 확인
-            pending_logs = self.log_storage_manager.count_pending_logs()
-            total_pending = sum(pending_logs.values())
-            print(f"[DEBUG] 현재 백엔드 전송 대기 로그 개수: 총 {total_pending}개 (GPS: {pending_logs['gps']}, 전원: {pending_logs['power']}, 지오펜스: {pending_logs['geofence']}) - MDN: {mdn}")
-
-            # 미전송 로그 처리
-            if total_pending > 0:
-                print(f"[INFO] GPS 주기정보 전송 종료 후 미전송 로그 처리 시작 - MDN: {mdn}")
-                self.log_storage_manager.process_pending_logs()
+            # 미전송 로그 처리 (백그라운드 전송 스레드가 실행 중이면 스레드가 일괄 전송)
+            if not self.log_storage_manager.is_background_sender_running():
+                pending_logs, after_pending = self.log_storage_manager.flush_pending()
+                total_pending = sum(pending_logs.values())
+                logger.debug("현재 백엔드 전송 대기 로그 개수: 총 %s개 (GPS: %s, 전원: %s, 지오펜스: %s) - MDN: %s", total_pending, pending_logs['gps'], pending_logs['power'], pending_logs['geofence'], mdn)
 
-                # 처리 후 남은 로그 확인
-                after_pending = self.log_storage_manager.count_pending_logs()
-                after_total = sum(after_pending.values())
-                print(f"[INFO] 미전송 로그 처리 완료 - 처리 전: {total_pending}개, 처리 후: {after_total}개")
+                if total_pending > 0:
+                    after_total = sum(after_pending.values())
+                    logger.info("미전송 로그 처리 완료 - 처리 전: %s개, 처리 후: %s개", total_pending, after_total)
 
-                if after_total < total_pending:
-                    print(f"[SUCCESS] {total_pending - after_total}개의 로그가 성공적으로 전송됨")
-                else:
-                    print(f"[WARNING] 모든 로그 전송 실패 또는 새 로그 추가됨")
+                    if after_total < total_pending:
+                        logger.info("%s개의 로그가 성공적으로 전송됨", total_pending - after_total)
+                    else:
+                        logger.warning("모든 로그 전송 실패 또는 새 로그 추가됨")
 
-            print(f"[INFO] GPS 주기정보 전송 종료 후 처리 완료 - MDN: {mdn}")
+            logger.info("GPS 주기정보 전송 종료 후 처리 완료 - MDN: %s", mdn)
 
         return gps_log
 
 
-# 싱글톤 인스턴스
-data_generator = EmulatorDataGenerator()
+# 싱글톤 인스턴스 (처음 사용할 때 생성)
+_data_generator: Optional[EmulatorDataGenerator] = None
+_data_generator_lock = threading.Lock()
+
+# 모듈 수준 이름으로 노출하는 파사드 메서드
+# 예: from services.data_generator import process_gps_log
+_EXPORTED_METHODS = frozenset({
+    "generate_gps_log", "generate_power_log", "generate_geofence_log",
+    "store_gps_log", "store_power_log", "store_geofence_log",
+    "process_gps_log", "process_power_log"
+})
+
+
+def get_data_generator() -> EmulatorDataGenerator:
+    """
+    데이터 생성기 싱글톤 반환 (최초 호출 시 생성)
+    모듈을 import하는 것만으로 에뮬레이터 매니저와 로그 저장 관리자가 만들어지지 않도록 지연 생성합니다.
+
+    Returns:
+        EmulatorDataGenerator: 데이터 생성기 싱글톤
+    """
+    global _data_generator
+    if _data_generator is None:
+        with _data_generator_lock:
+            if _data_generator is None:
+                _data_generator = EmulatorDataGenerator()
+    return _data_generator
+
+
+def __getattr__(name: str):
+    """기존 import 경로(data_generator, 모듈 수준 파사드 메서드) 지원 - 첫 접근 시 싱글톤 생성"""
+    if name == "data_generator":
+        value = get_data_generator()
+    elif name in _EXPORTED_METHODS:
+        value = getattr(get_data_generator(), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # 이후 접근은 모듈 전역에서 바로 찾도록 저장
+    globals()[name] = value
+    return value
@@ -1,11 +1,110 @@
+import atexit
+import functools
+import inspect
+import logging
+import math
 import random
 import sys
 import time
 import threading
-import requests
+from array import array
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from models.emulator_data import VehicleData
+from models.gps_sample_buffer import GpsSampleBuffer
+
+logger = logging.getLogger(__name__)
+
+
+def _cleanup_before_exit():
+    """프로그램 종료 전 정리 작업 (경로 주행 완료로 종료할 때 atexit에 등록)"""
+    logger.info("프로그램 종료 전 정리 작업 수행 중...")
+    # 여기에 필요한 정리 작업 코드 추가 가능
+
+
+class MdnLoggerAdapter(logging.LoggerAdapter):
+    """
+    로그 메시지 끝에 " - MDN: <MDN>"을 붙이는 로거 어댑터
+    MDN은 로그 레벨이 활성화되어 실제로 기록할 때만 에뮬레이터 매니저에서 읽어 붙입니다.
+    """
+
+    def __init__(self, base_logger: logging.Logger, emulator_manager: "EmulatorManager"):
+        super().__init__(base_logger, {})
+        # LoggerAdapter.manager는 로거의 logging.Manager를 가리키므로 다른 이름 사용
+        self.emulator_manager = emulator_manager
+
+    def log(self, level, msg, *args, **kwargs):
+        if self.isEnabledFor(level):
+            # MDN도 일반 인자로 넘겨 실제로 기록할 때만 포맷되도록 함 (호출 위치는 이 메서드를 건너뛴 원래 호출자로 표시)
+            kwargs.setdefault("stacklevel", 2)
+            # 인자 없이 호출된 메시지는 %를 그대로 출력해야 하므로 MDN 인자를 붙이기 전에 이스케이프
+            if not args:
+                msg = str(msg).replace("%", "%%")
+            self.logger.log(level, msg + " - MDN: %s", *args, self.emulator_manager.mdn, **kwargs)
+
+
+def require_own_mdn(mismatch_result: Any = False, log_mismatch: bool = False):
+    """
+    요청된 MDN이 현재 에뮬레이터의 MDN과 다르면 메서드를 실행하지 않고 mismatch_result를 반환하는 데코레이터
+    MDN이 지정되지 않았거나(None) 일치하면 원래 메서드를 그대로 호출합니다.
+
+    Args:
+        mismatch_result: MDN 불일치 시 반환할 값
+        log_mismatch: MDN 불일치를 오류 로그로 남길지 여부
+    """
+    def decorator(func):
+        # mdn 인자의 위치 (self 제외) - 위치 인자로 전달된 경우에도 확인하기 위함
+        mdn_position = list(inspect.signature(func).parameters).index("mdn") - 1
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            mdn = args[mdn_position] if len(args) > mdn_position else kwargs.get("mdn")
+            if mdn is not None and mdn != self.mdn:
+                if log_mismatch:
+                    self.log.error("요청된 MDN(%s)이 현재 에뮬레이터의 MDN과 일치하지 않습니다.", mdn)
+                return mismatch_result
+            return func(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def distance_and_bearing(lat1: float, lon1: float, lat2: float, lon2: float) -> Tuple[float, float]:
+    """
+    두 좌표 사이의 거리(Haversine 공식)와 방위각(북쪽이 0도, 시계 방향)을 함께 계산
+    두 계산이 공유하는 라디안 변환과 sin/cos 값을 한 번만 구합니다.
+    (BaseLogGenerator.calculate_distance도 이 함수의 거리 값을 사용합니다.)
+
+    Args:
+        lat1: 시작 위도
+        lon1: 시작 경도
+        lat2: 종료 위도
+        lon2: 종료 경도
+
+    Returns:
+        Tuple[float, float]: (거리(미터), 방위각(0~360도)) - 이동이 없으면 방위각은 0
+    """
+    sin, cos = math.sin, math.cos
+
+    # 위도/경도를 라디안으로 변환
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    delta_lambda = math.radians(lon2 - lon1)
+    cos_phi1 = cos(phi1)
+    cos_phi2 = cos(phi2)
+
+    # 거리 (지구 반경 6,371,000 미터)
+    a = sin(math.radians(lat2 - lat1) / 2) ** 2 + cos_phi1 * cos_phi2 * sin(delta_lambda / 2) ** 2
+    distance = 6371000 * (2 * math.atan2(math.sqrt(a), math.sqrt(1 - a)))
+    if distance <= 0:
+        return distance, 0.0
+
+    # 방위각
+    y = sin(delta_lambda) * cos_phi2
+    x = cos_phi1 * sin(phi2) - sin(phi1) * cos_phi2 * cos(delta_lambda)
+    return distance, (math.degrees(math.atan2(y, x)) + 360) % 360
+
 
 class EmulatorManager:
     """
@@ -15,9 +114,31 @@ class EmulatorManager:
     - 위치, 승객, 시간 등의 데이터 관리
     """
 
+    # 백엔드 API 설정 (인스턴스마다 바뀌지 않으므로 클래스 속성으로 둠)
+    backend_url = "http://localhost:8080/api/vehicles"
+
+    __slots__ = (
+        # 단말기 정보
+        "mdn", "log", "terminal_id", "manufacture_id", "packet_version", "device_id", "device_firmware_version",
+        # 차량 상태
+        "last_latitude", "last_longitude", "is_active", "last_update", "accumulated_distance",
+        "mdn_accumulated_distances", "last_position", "last_position_fixed", "last_positions", "last_power_on_time",
+        # 실시간 데이터 수집
+        "last_gps_batch_data", "data_timer", "collecting_data", "collect_batch_size",
+        "data_callback", "stop_event", "shutdown_event",
+        # 카카오 API 경로
+        "kakao_route_points", "current_route_index", "route_finalized",
+        "route_length", "route_latitudes", "route_longitudes",
+        "route_segment_distances", "route_segment_bearings",
+        # 호환용 에뮬레이터 정보 딕셔너리
+        "emulator_dict"
+    )
+
     def __init__(self, mdn: str = "01012345678"):
         # 고정 MDN 설정
         self.mdn = mdn
+        # 메시지 끝에 MDN을 붙여 기록하는 로거
+        self.log = MdnLoggerAdapter(logger, self)
 
         # 에뮬레이터 정보 저장
         self.terminal_id = f"TERM-{mdn[-4:]}"
@@ -30,49 +151,50 @@ class EmulatorManager:
         self.last_latitude = 37.5665 + random.uniform(-0.01, 0.01)
         self.last_longitude = 126.9780 + random.uniform(-0.01, 0.01)
         self.is_active = False
-        self.last_update = datetime.now()
+        self.last_update = datetime.now()  # 이후 초기 위치 기록에도 같은 시각 사용
         self.accumulated_distance = 0  # 누적 주행거리 (미터)
+        self.last_power_on_time = ""  # 마지막 시동 ON 시간 (시동 OFF 로그에 사용)
+
+        # get_emulator_dict()가 재사용하는 딕셔너리 (호출 시 현재 상태로 갱신)
+        self.emulator_dict = {}
 
         # MDN별 누적 주행거리 저장을 위한 딕셔너리
         self.mdn_accumulated_distances = {}
 
-        # 마지막 위치 캐시 (시동 OFF 시 마지막 위치 저장)
-        self.last_position = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
+        # 마지막 위치 저장 (시동 OFF 시 사용, 이후에는 같은 딕셔너리를 제자리에서 갱신)
+        self.last_position = {}
+        self.save_last_position(self.last_update)
 
         # 마지막 GPS 주기정보 데이터 포인트 저장
         self.last_gps_batch_data = None
 
         # 실시간 데이터 수집을 위한 타이머 스레드 관리
         self.data_timer = None
-        self.collecting_data = []
+        # 수집 중인 GPS 포인트 (항목별 배열 버퍼)
+        self.collecting_data = GpsSampleBuffer()
+        # 수집 버퍼를 미리 할당할 크기 (실시간 수집 시작 시 배치 크기로 설정)
+        self.collect_batch_size = 0
         self.data_callback = None
-        self.stop_event = None
-
-        # 여러 에뮬레이터의 데이터 타이머 관리를 위한 딕셔너리
-        self.data_timers = {}
-
-        # 백엔드 API 설정
-        self.backend_url = "http://localhost:8080/api/vehicles"
-
-        # 이전 버전과의 호환성을 위한 active_emulators 딕셔너리
-        self.active_emulators = {self.mdn: self.get_emulator_dict()}
+        # 수집 스레드 중지 신호 (수집을 시작할 때마다 새 이벤트로 교체)
+        self.stop_event = threading.Event()
+        # 경로 주행 완료 등으로 프로그램 종료가 필요할 때 메인 스레드에 알리는 이벤트
+        self.shutdown_event = threading.Event()
 
         # 여러 에뮬레이터의 마지막 위치 저장을 위한 딕셔너리
-        self.last_positions = {
-            self.mdn: {
-                "latitude": self.last_latitude,
-                "longitude": self.last_longitude,
-                "timestamp": datetime.now()
-            }
-        }
+        self.last_positions = {}
+        self.update_last_positions(self.last_latitude, self.last_longitude, self.last_update)
 
         # 카카오 API 경로 데이터 저장
         self.kakao_route_points = []  # 카카오 API에서 가져온 경로 포인트 목록
         self.current_route_index = 0  # 현재 사용 중인 경로 포인트 인덱스
+        self.route_finalized = False  # 경로 주행 완료 처리 수행 여부
+        # 경로 포인트 수와 좌표 배열 (경로 설정 시 한 번 구성, 위치 업데이트 틱에서는 인덱스로 조회만 함)
+        self.route_length = 0
+        self.route_latitudes = array("d")
+        self.route_longitudes = array("d")
+        # 경로 구간별 거리(미터)/방위각 - i번째 값은 (i-1)번째 포인트에서 i번째 포인트까지 (경로 설정 시 한 번 계산)
+        self.route_segment_distances = array("d")
+        self.route_segment_bearings = array("d")
 
     def start_emulator(self, terminal_id: str = None, manufacture_id: int = None, 
                         packet_version: int = None, device_id: int = None, device_firmware_version: str = None) -> bool:
@@ -112,56 +234,31 @@ class EmulatorManager:
         # 저장된 누적 거리 사용
         self.accumulated_distance = self.mdn_accumulated_distances[self.mdn]
 
-        # 마지막 위치 저장
-        self.last_position = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
-
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.active_emulators = {self.mdn: self.get_emulator_dict()}
+        # 마지막 위치 저장 (시동 OFF 시 사용) - 시작 시각을 함께 기록
+        self.save_last_position(self.last_update)
 
         # 마지막 위치 정보 업데이트
-        self.last_positions[self.mdn] = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
+        self.update_last_positions(self.last_latitude, self.last_longitude, self.last_update)
 
         # 백엔드 powerOn 업데이트 제거 - 로그만 남김
-        print(f"[INFO] 차량 에뮬레이터 시작: MDN={self.mdn}")
+        self.log.info("차량 에뮬레이터 시작")
 
         return True
 
+    @require_own_mdn(False, log_mismatch=True)
     def stop_emulator(self, mdn: str = None) -> bool:
         """
         에뮬레이터 데이터 생성 중지
 
         Args:
-            mdn: 차량 번호 (단말기 번호), 기본값은 None (무시됨)
+            mdn: 차량 번호 (단말기 번호), 기본값은 None (현재 에뮬레이터의 MDN 사용)
         """
-        # MDN이 지정되지 않은 경우 현재 에뮬레이터의 MDN 사용
-        if mdn is None:
-            mdn = self.mdn
-
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn != self.mdn:
-            print(f"[ERROR] 현재 에뮬레이터의 MDN({self.mdn})과 요청된 MDN({mdn})이 일치하지 않습니다.")
-            return False
         # 마지막 위치 저장 (시동 OFF 시 사용)
-        self.last_position = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
+        now = datetime.now()
+        self.save_last_position(now)
 
         # 마지막 위치 정보 업데이트
-        self.last_positions[self.mdn] = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
+        self.update_last_positions(self.last_latitude, self.last_longitude, now)
 
         # 에뮬레이터 비활성화 처리
         self.is_active = False
@@ -169,17 +266,15 @@ class EmulatorManager:
         # 실시간 데이터 생성 타이머 중지
         self.stop_realtime_data_collection()
 
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.active_emulators = {self.mdn: self.get_emulator_dict()}
-
         # 백엔드 powerOff 업데이트 제거 - 로그만 남김
-        print(f"[INFO] 차량 에뮬레이터 중지: MDN={self.mdn}")
+        self.log.info("차량 에뮬레이터 중지")
 
         # 프로그램 정상 종료를 위해 sys.exit(0) 대신 True 반환
-        print(f"[INFO] 에뮬레이터가 중지되었습니다. 정상적인 종료 프로세스를 진행합니다.")
+        self.log.info("에뮬레이터가 중지되었습니다. 정상적인 종료 프로세스를 진행합니다.")
 
         return True
 
+    @require_own_mdn(False, log_mismatch=True)
     def start_realtime_data_collection(self, mdn: str = None, callback: Callable[[str, list], None] = None, 
                                   interval_sec: float = 1.0, batch_size: int = 60, send_interval_sec: float = 60.0):
         """
@@ -192,39 +287,31 @@ class EmulatorManager:
             batch_size: 데이터 수집 배치 크기
             send_interval_sec: 데이터 전송 주기 (초)
         """
-        # MDN이 지정되지 않은 경우 현재 에뮬레이터의 MDN 사용
-        if mdn is None:
-            mdn = self.mdn
-
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn != self.mdn:
-            print(f"[ERROR] 현재 에뮬레이터의 MDN({self.mdn})과 요청된 MDN({mdn})이 일치하지 않습니다.")
-            return False
-
         # 기존 타이머가 있다면 먼저 중지
-        self.stop_realtime_data_collection(mdn)
+        self.stop_realtime_data_collection()
 
         # 새로운 데이터 수집 시작
         if self.is_active:
-            self.collecting_data = []
+            self.collect_batch_size = batch_size
+            self.collecting_data = GpsSampleBuffer(batch_size)
             self.data_callback = callback
 
-            # 타이머 스레드 생성
+            # 타이머 스레드 생성 (종료 시 정리 작업이 끝까지 수행되도록 데몬 스레드로 만들지 않음)
             self.stop_event = threading.Event()
             self.data_timer = threading.Thread(
                 target=self._data_collection_worker,
                 args=(interval_sec, batch_size, send_interval_sec, self.stop_event),
-                daemon=True
+                daemon=False
             )
 
-            # 타이머 시작 및 data_timers에 저장
+            # 타이머 시작
             self.data_timer.start()
-            self.data_timers[mdn] = self.data_timer
 
-            print(f"Started real-time data collection for MDN: {mdn}")
+            self.log.info("Started real-time data collection")
             return True
         return False
 
+    @require_own_mdn(False, log_mismatch=True)
     def stop_realtime_data_collection(self, mdn: str = None) -> bool:
         """
         실시간 데이터 수집 중지
@@ -235,29 +322,19 @@ class EmulatorManager:
         Returns:
             bool: 중지 성공 여부
         """
-        # MDN이 지정되지 않은 경우 현재 에뮬레이터의 MDN 사용
-        if mdn is None:
-            mdn = self.mdn
-
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn != self.mdn:
-            print(f"[ERROR] 현재 에뮬레이터의 MDN({self.mdn})과 요청된 MDN({mdn})이 일치하지 않습니다.")
-            return False
-
-        # data_timers에서 해당 MDN의 타이머 제거
-        if mdn in self.data_timers:
-            del self.data_timers[mdn]
-
-        if self.data_timer and self.stop_event:
+        if self.data_timer:
             self.stop_event.set()
 
             # 현재 스레드가 data_timer 스레드인지 확인
             current_thread = threading.current_thread()
             if current_thread != self.data_timer:
                 # 다른 스레드에서 호출된 경우에만 join 시도
+                # (대기 중인 스레드는 중지 신호로 바로 깨어나므로 제한 시간은 콜백 처리 중일 때만 의미가 있음)
                 self.data_timer.join(timeout=2.0)
+                if self.data_timer.is_alive():
+                    self.log.warning("데이터 수집 스레드가 제한 시간 내에 종료되지 않았습니다")
             else:
-                print(f"[INFO] 데이터 수집 스레드 내에서 중지 요청됨 - join 건너뜀")
+                self.log.info("데이터 수집 스레드 내에서 중지 요청됨 - join 건너뜀")
 
             self.data_timer = None
 
@@ -266,18 +343,17 @@ class EmulatorManager:
                 # 마지막 데이터 포인트 저장 (추가된 코드)
                 if self.collecting_data:
                     self.last_gps_batch_data = self.collecting_data[-1]
-                    print(f"[DEBUG] 남은 데이터의 마지막 GPS 주기정보 저장 - MDN: {self.mdn}, 좌표: ({self.last_gps_batch_data['latitude']}, {self.last_gps_batch_data['longitude']})")
+                    self.log.debug("남은 데이터의 마지막 GPS 주기정보 저장 - 좌표: (%s, %s)", self.last_gps_batch_data['latitude'], self.last_gps_batch_data['longitude'])
 
-                self.data_callback(self.mdn, self.collecting_data)
-                self.collecting_data = []
+                self.data_callback(self.mdn, self._take_collected_data())
 
             return True
         return False
 
     def stop_realtime_data_collection_all(self):
         """실시간 데이터 수집 타이머 중지"""
-        if hasattr(self, 'data_timer') and self.data_timer:
-            print("[INFO] 실시간 데이터 수집 타이머 중지")
+        if self.data_timer:
+            self.log.info("실시간 데이터 수집 타이머 중지")
             self.stop_realtime_data_collection(self.mdn)
             return True
         return False
@@ -286,200 +362,139 @@ class EmulatorManager:
         """
         에뮬레이터 위치 업데이트 (카카오 API 경로 데이터 사용)
         """
-        print(f"[DEBUG] 위치 업데이트 시작 - MDN: {self.mdn}, 활성 상태: {self.is_active}")
+        self.log.debug("위치 업데이트 시작 - 활성 상태: %s", self.is_active)
 
         if not self.is_active:
-            print(f"[DEBUG] 에뮬레이터가 비활성 상태입니다. 위치 업데이트를 건너뜁니다 - MDN: {self.mdn}")
+            self.log.debug("에뮬레이터가 비활성 상태입니다. 위치 업데이트를 건너뜁니다")
             return
 
         # 현재 좌표값 확인
-        print(f"[DEBUG] 현재 좌표: ({self.last_latitude}, {self.last_longitude}) - MDN: {self.mdn}")
+        self.log.debug("현재 좌표: (%s, %s)", self.last_latitude, self.last_longitude)
 
         # 좌표가 비정상적으로 작은 경우 (서울 좌표로 초기화)
         if abs(self.last_latitude) < 1.0:  # 위도가 1도보다 작으면 비정상으로 판단
-            print(f"[WARNING] 비정상 좌표 감지: ({self.last_latitude}, {self.last_longitude}) - MDN: {self.mdn}")
+            self.log.warning("비정상 좌표 감지: (%s, %s)", self.last_latitude, self.last_longitude)
             self.last_latitude = 37.5665
             self.last_longitude = 126.9780
-            print(f"[INFO] 위치 초기화: {self.mdn} - 서울 좌표로 재설정 (37.5665, 126.9780)")
+            self.log.info("위치 초기화: 서울 좌표로 재설정 (37.5665, 126.9780)")
 
         # 카카오 API 경로 데이터 확인
-        has_route_data = self.kakao_route_points and len(self.kakao_route_points) > 0
-        print(f"[DEBUG] 카카오 API 경로 데이터 상태: {'있음' if has_route_data else '없음'}, 포인트 수: {len(self.kakao_route_points) if has_route_data else 0} - MDN: {self.mdn}")
+        route_length = self.route_length
+        self.log.debug("카카오 API 경로 데이터 상태: %s, 포인트 수: %s", '있음' if route_length else '없음', route_length)
 
         # 카카오 API 경로 데이터가 있는 경우 해당 데이터 사용
-        if has_route_data:
+        if route_length:
             # 현재 인덱스 확인
-            print(f"[DEBUG] 현재 경로 인덱스: {self.current_route_index}, 전체 포인트 수: {len(self.kakao_route_points)} - MDN: {self.mdn}")
+            index = self.current_route_index
+            self.log.debug("현재 경로 인덱스: %s, 전체 포인트 수: %s", index, route_length)
 
             # 현재 인덱스가 유효한지 확인
-            if self.current_route_index < len(self.kakao_route_points):
-                # 현재 경로 포인트 가져오기
-                current_point = self.kakao_route_points[self.current_route_index]
-                print(f"[DEBUG] 현재 경로 포인트: {current_point} - MDN: {self.mdn}")
-
+            if index < route_length:
                 # 이전 위치 저장 (디버깅용)
                 prev_lat = self.last_latitude
                 prev_lon = self.last_longitude
 
-                # 위치 업데이트
-                self.last_latitude = current_point["latitude"]
-                self.last_longitude = current_point["longitude"]
-                print(f"[DEBUG] 위치 업데이트 - 이전: ({prev_lat}, {prev_lon}), 새 위치: ({self.last_latitude}, {self.last_longitude}) - MDN: {self.mdn}")
+                # 위치 업데이트 (현재 경로 포인트 좌표)
+                self.last_latitude = self.route_latitudes[index]
+                self.last_longitude = self.route_longitudes[index]
+                self.log.debug("위치 업데이트 - 이전: (%s, %s), 새 위치: (%s, %s)", prev_lat, prev_lon, self.last_latitude, self.last_longitude)
 
                 # 다음 포인트로 인덱스 이동
-                self.current_route_index += 1
-                print(f"[DEBUG] 다음 경로 인덱스로 이동: {self.current_route_index} - MDN: {self.mdn}")
+                index += 1
+                self.current_route_index = index
+                self.log.debug("다음 경로 인덱스로 이동: %s", index)
 
                 # 모든 경로 포인트를 사용한 경우 에뮬레이터 중지 및 프로그램 종료
-                if self.current_route_index >= len(self.kakao_route_points):
-                    print(f"[INFO] 모든 경로 포인트를 사용했습니다. 에뮬레이터를 중지합니다 - MDN: {self.mdn}")
-
-                    # 남은 데이터 처리 (에뮬레이터 중지 전에 수행)
-                    if self.collecting_data and self.data_callback and callable(self.data_callback):
-                        # 마지막 데이터 포인트 저장 (추가된 코드)
-                        if self.collecting_data:
-                            self.last_gps_batch_data = self.collecting_data[-1]
-                            print(f"[DEBUG] 남은 데이터의 마지막 GPS 주기정보 저장 - MDN: {self.mdn}, 좌표: ({self.last_gps_batch_data['latitude']}, {self.last_gps_batch_data['longitude']})")
-
-                        print(f"[INFO] 남은 데이터 처리 중 - {len(self.collecting_data)}개 데이터 포인트 - MDN: {self.mdn}")
-                        self.data_callback(self.mdn, self.collecting_data)
-                        self.collecting_data = []
-
-                    # 로그 전송을 위한 대기 시간 추가
-                    print(f"[INFO] 목적지에 도달했습니다. 로그 전송을 위해 잠시 대기합니다 - MDN: {self.mdn}")
-                    import time
-                    time.sleep(2)  # 2초 대기
-
-                    # 미전송 로그 처리
-                    from services.data_generator import data_generator
-                    pending_logs = data_generator.log_storage_manager.count_pending_logs()
-                    total_pending = sum(pending_logs.values())
-                    if total_pending > 0:
-                        print(f"[INFO] 종료 전 미전송 로그 처리 시작 - MDN: {self.mdn}")
-                        data_generator.log_storage_manager.process_pending_logs()
-
-                    # GPS 로그 전송 후 시동 OFF 로그 생성 및 전송
-                    print(f"[INFO] GPS 로그 전송 완료. 시동 OFF 로그 생성 및 전송 시작 - MDN: {self.mdn}")
-                    data_generator.stop_vehicle(self.mdn)
-
-                    # 시동 OFF 로그 전송을 위한 추가 대기
-                    print(f"[INFO] 시동 OFF 로그 전송을 위해 잠시 대기합니다 - MDN: {self.mdn}")
-                    import time
-                    time.sleep(1)  # 1초 대기
-
-                    # 시동 OFF 로그 전송 확인
-                    pending_logs = data_generator.log_storage_manager.count_pending_logs()
-                    power_pending = pending_logs.get('power', 0)
-                    if power_pending > 0:
-                        print(f"[INFO] 시동 OFF 로그 전송 시도 중 - 대기 중인 전원 로그: {power_pending}개")
-                        data_generator.log_storage_manager.process_pending_logs()
-
-                    # 에뮬레이터 비활성화
-                    self.is_active = False
-                    if self.stop_event:
-                        self.stop_event.set()
-
-                    # 에뮬레이터 중지 (스레드 안전하게)
-                    self.stop_emulator()
-
-                    print(f"[INFO] 목적지에 도달했습니다. 프로그램을 종료합니다 - MDN: {self.mdn}")
-
-                    # 종료 처리를 위한 함수 정의
-                    def cleanup_and_exit():
-                        print(f"[INFO] 프로그램 종료 전 정리 작업 수행 중...")
-                        # 여기에 필요한 정리 작업 코드 추가 가능
-
-                    # 정리 함수 등록 (이미 등록되어 있다면 다시 등록할 필요 없음)
-                    import atexit
-                    atexit.register(cleanup_and_exit)
-
-                    # 프로그램 종료 - 자동으로 등록된 모든 atexit 핸들러가 호출됨
-                    import sys
-                    sys.exit(0)
+                if index == route_length:
+                    self._finalize_route_and_exit()
             else:
                 # 인덱스가 범위를 벗어난 경우 에뮬레이터 중지 및 프로그램 종료
-                print(f"[WARNING] 경로 인덱스가 범위를 벗어났습니다: {self.current_route_index} >= {len(self.kakao_route_points)} - MDN: {self.mdn}")
-                print(f"[INFO] 모든 경로 포인트를 사용했습니다. 에뮬레이터를 중지합니다 - MDN: {self.mdn}")
-
-                # 남은 데이터 처리 (에뮬레이터 중지 전에 수행)
-                if self.collecting_data and self.data_callback and callable(self.data_callback):
-                    # 마지막 데이터 포인트 저장 (추가된 코드)
-                    if self.collecting_data:
-                        self.last_gps_batch_data = self.collecting_data[-1]
-                        print(f"[DEBUG] 남은 데이터의 마지막 GPS 주기정보 저장 - MDN: {self.mdn}, 좌표: ({self.last_gps_batch_data['latitude']}, {self.last_gps_batch_data['longitude']})")
-
-                    print(f"[INFO] 남은 데이터 처리 중 - {len(self.collecting_data)}개 데이터 포인트 - MDN: {self.mdn}")
-                    self.data_callback(self.mdn, self.collecting_data)
-                    self.collecting_data = []
-
-                # 로그 전송을 위한 대기 시간 추가
-                print(f"[INFO] 목적지에 도달했습니다. 로그 전송을 위해 잠시 대기합니다 - MDN: {self.mdn}")
-                import time
-                time.sleep(2)  # 2초 대기
-
-                # 미전송 로그 처리
-                from services.data_generator import data_generator
-                pending_logs = data_generator.log_storage_manager.count_pending_logs()
-                total_pending = sum(pending_logs.values())
-                if total_pending > 0:
-                    print(f"[INFO] 종료 전 미전송 로그 처리 시작 - MDN: {self.mdn}")
-                    data_generator.log_storage_manager.process_pending_logs()
-
-                # GPS 로그 전송 후 시동 OFF 로그 생성 및 전송
-                print(f"[INFO] GPS 로그 전송 완료. 시동 OFF 로그 생성 및 전송 시작 - MDN: {self.mdn}")
-                data_generator.stop_vehicle(self.mdn)
-
-                # 시동 OFF 로그 전송을 위한 추가 대기
-                print(f"[INFO] 시동 OFF 로그 전송을 위해 잠시 대기합니다 - MDN: {self.mdn}")
-                import time
-                time.sleep(1)  # 1초 대기
-
-                # 시동 OFF 로그 전송 확인
-                pending_logs = data_generator.log_storage_manager.count_pending_logs()
-                power_pending = pending_logs.get('power', 0)
-                if power_pending > 0:
-                    print(f"[INFO] 시동 OFF 로그 전송 시도 중 - 대기 중인 전원 로그: {power_pending}개")
-                    data_generator.log_storage_manager.process_pending_logs()
-
-                # 에뮬레이터 비활성화
-                self.is_active = False
-                if self.stop_event:
-                    self.stop_event.set()
-
-                # 에뮬레이터 중지 (스레드 안전하게)
-                self.stop_emulator()
-
-                print(f"[INFO] 목적지에 도달했습니다. 프로그램을 종료합니다 - MDN: {self.mdn}")
-
-                # 종료 처리를 위한 함수 정의
-                def cleanup_and_exit():
-                    print(f"[INFO] 프로그램 종료 전 정리 작업 수행 중...")
-                    # 여기에 필요한 정리 작업 코드 추가 가능
-
-                # 정리 함수 등록 (이미 등록되어 있다면 다시 등록할 필요 없음)
-                import atexit
-                atexit.register(cleanup_and_exit)
-
-                # 프로그램 종료 - 자동으로 등록된 모든 atexit 핸들러가 호출됨
-                import sys
-                sys.exit(0)
+                self.log.warning("경로 인덱스가 범위를 벗어났습니다: %s >= %s", index, route_length)
+                self._finalize_route_and_exit()
         else:
             # 카카오 API 경로 데이터가 없는 경우 오류 메시지 출력
-            print(f"[WARNING] 카카오 API 경로 데이터가 없습니다. 위치 업데이트를 건너뜁니다 - MDN: {self.mdn}")
+            self.log.warning("카카오 API 경로 데이터가 없습니다. 위치 업데이트를 건너뜁니다")
             # 위치는 변경하지 않음
-            print(f"[DEBUG] 위치 유지: ({self.last_latitude}, {self.last_longitude}) - MDN: {self.mdn}")
-
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.active_emulators = {self.mdn: self.get_emulator_dict()}
-        print(f"[DEBUG] active_emulators 업데이트 완료 - MDN: {self.mdn}")
+            self.log.debug("위치 유지: (%s, %s)", self.last_latitude, self.last_longitude)
 
         # 마지막 위치 정보 업데이트
-        self.last_positions[self.mdn] = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
-        print(f"[DEBUG] 마지막 위치 정보 업데이트 완료 - MDN: {self.mdn}, 좌표: ({self.last_latitude}, {self.last_longitude})")
+        self.update_last_positions(self.last_latitude, self.last_longitude)
+        self.log.debug("마지막 위치 정보 업데이트 완료 - 좌표: (%s, %s)", self.last_latitude, self.last_longitude)
+
+    def _finalize_route_and_exit(self):
+        """
+        경로 주행 완료 처리 후 종료
+        남은 GPS 데이터와 미전송 로그를 전송하고 시동 OFF 로그를 보낸 뒤 에뮬레이터를 중지하고 종료합니다.
+        같은 경로에 대해 한 번만 수행합니다.
+        """
+        if self.route_finalized:
+            return
+        self.route_finalized = True
+
+        self.log.info("모든 경로 포인트를 사용했습니다. 에뮬레이터를 중지합니다")
+
+        # 남은 데이터 처리 (에뮬레이터 중지 전에 수행)
+        if self.collecting_data and self.data_callback and callable(self.data_callback):
+            # 마지막 데이터 포인트 저장
+            self.last_gps_batch_data = self.collecting_data[-1]
+            self.log.debug("남은 데이터의 마지막 GPS 주기정보 저장 - 좌표: (%s, %s)", self.last_gps_batch_data['latitude'], self.last_gps_batch_data['longitude'])
+
+            self.log.info("남은 데이터 처리 중 - %s개 데이터 포인트", len(self.collecting_data))
+            self.data_callback(self.mdn, self._take_collected_data())
+
+        # 로그 전송을 위한 대기 시간 추가 (중지 신호가 오면 바로 진행)
+        self.log.info("목적지에 도달했습니다. 로그 전송을 위해 잠시 대기합니다")
+        self._wait_or_stop(2)
+
+        # 미전송 로그 처리 (data_generator가 이 모듈을 import하므로 여기서 가져옴)
+        from services.data_generator import data_generator
+        pending_logs, _ = data_generator.log_storage_manager.flush_pending()
+        if any(pending_logs.values()):
+            self.log.info("종료 전 미전송 로그 처리 완료")
+
+        # GPS 로그 전송 후 시동 OFF 로그 생성 및 전송
+        self.log.info("GPS 로그 전송 완료. 시동 OFF 로그 생성 및 전송 시작")
+        data_generator.stop_vehicle(self.mdn)
+
+        # 시동 OFF 로그 전송을 위한 추가 대기
+        self.log.info("시동 OFF 로그 전송을 위해 잠시 대기합니다")
+        self._wait_or_stop(1)
+
+        # 시동 OFF 로그 전송 확인
+        pending_logs, _ = data_generator.log_storage_manager.flush_pending()
+        power_pending = pending_logs.get('power', 0)
+        if power_pending > 0:
+            self.log.info("시동 OFF 로그 전송 시도 완료 - 대기 중이던 전원 로그: %s개", power_pending)
+
+        # 에뮬레이터 비활성화
+        self.is_active = False
+        self.stop_event.set()
+
+        # 에뮬레이터 중지 (스레드 안전하게)
+        self.stop_emulator()
+
+        self.log.info("목적지에 도달했습니다. 프로그램을 종료합니다")
+
+        # 정리 함수 등록 (경로를 여러 번 주행해도 한 번만 등록되도록 기존 등록을 먼저 해제)
+        atexit.unregister(_cleanup_before_exit)
+        atexit.register(_cleanup_before_exit)
+
+        # 메인 스레드에 종료를 알림
+        self.shutdown_event.set()
+
+        # 메인 스레드에서 호출된 경우 바로 종료 - 자동으로 등록된 모든 atexit 핸들러가 호출됨
+        # (수집 스레드에서 sys.exit를 호출하면 해당 스레드만 끝나므로, 종료는 메인 스레드가 이벤트를 받아 처리)
+        if threading.current_thread() is threading.main_thread():
+            sys.exit(0)
+
+    def _wait_or_stop(self, seconds: float) -> None:
+        """
+        지정한 시간만큼 대기 (수집 중지 신호가 오면 즉시 반환)
+
+        Args:
+            seconds: 대기 시간 (초)
+        """
+        self.stop_event.wait(seconds)
 
     def _data_collection_worker(self, interval_sec: float, batch_size: int, send_interval_sec: float, stop_event: threading.Event):
         """
@@ -494,26 +509,45 @@ class EmulatorManager:
         count = 0
         prev_lat = self.last_latitude
         prev_lon = self.last_longitude
-        prev_time = datetime.now()
+        # 간격 계산은 시스템 시각 변경의 영향을 받지 않는 monotonic 시계 사용 (초)
+        prev_tick = time.monotonic()
         prev_speed = 0.0
         prev_angle = 0.0
-        last_send_time = datetime.now()
+        last_send_tick = prev_tick
+
+        # 직전 틱에서 이동한 경로 포인트 인덱스 (연속 이동이면 미리 계산한 구간 값 사용)
+        prev_route_index = -1
+
+        # random.uniform은 파이썬 함수이므로 C 구현인 random.random을 직접 사용 (배터리 = 70 + 30 * [0, 1))
+        random_value = random.random
+
+        # 다음 생성 시각 (monotonic 초) - 작업 시간만큼 주기가 밀리지 않도록 마감 시각 기준으로 대기
+        next_deadline = prev_tick + interval_sec
 
         while not stop_event.is_set():
             # 에뮬레이터가 활성화 상태인 경우만 데이터 생성
             if self.is_active:
-                # 현재 시간
-                current_time = datetime.now()
+                # 현재 시간 (포인트 타임스탬프용 epoch 초, 간격 계산용 monotonic 초)
+                current_time = time.time()
+                current_tick = time.monotonic()
 
                 # 실시간 데이터 생성 - 위치 업데이트
                 self.update_position()
-
-                # 이동 거리 계산 (미터)
-                from services.log_generators.base_log_generator import BaseLogGenerator
-                distance = BaseLogGenerator.calculate_distance(None, prev_lat, prev_lon, self.last_latitude, self.last_longitude)
+                # 경로 주행 완료로 수집이 중지된 경우 바로 종료
+                if stop_event.is_set():
+                    break
+
+                # 이동 거리(미터)와 방위각 - 직전 포인트에서 다음 포인트로 이동한 경우 미리 계산한 구간 값 사용
+                route_index = self.current_route_index - 1
+                if 0 < route_index == prev_route_index + 1 and route_index < self.route_length:
+                    distance = self.route_segment_distances[route_index]
+                    bearing = self.route_segment_bearings[route_index]
+                else:
+                    distance, bearing = distance_and_bearing(prev_lat, prev_lon, self.last_latitude, self.last_longitude)
+                prev_route_index = route_index
 
                 # 시간 간격 계산 (초)
-                time_diff = (current_time - prev_time).total_seconds()
+                time_diff = current_tick - prev_tick
                 if time_diff <= 0:
                     time_diff = interval_sec  # 시간 차이가 없거나 음수인 경우 interval_sec 사용
 
@@ -530,18 +564,7 @@ class EmulatorManager:
 
                 # 방향각 계산 (두 좌표 사이의 방위각)
                 if distance > 0:
-                    import math
-                    # 위도/경도를 라디안으로 변환
-                    lat1_rad = math.radians(prev_lat)
-                    lon1_rad = math.radians(prev_lon)
-                    lat2_rad = math.radians(self.last_latitude)
-                    lon2_rad = math.radians(self.last_longitude)
-
-                    # 방위각 계산 (북쪽이 0도, 시계 방향)
-                    y = math.sin(lon2_rad - lon1_rad) * math.cos(lat2_rad)
-                    x = math.cos(lat1_rad) * math.sin(lat2_rad) - math.sin(lat1_rad) * math.cos(lat2_rad) * math.cos(lon2_rad - lon1_rad)
-                    angle_rad = math.atan2(y, x)
-                    angle = (math.degrees(angle_rad) + 360) % 360
+                    angle = bearing
 
                     # 급격한 방향 변화 방지를 위한 스무딩 (이전 방향의 80%, 현재 방향의 20%)
                     # 단, 방향 차이가 180도 이상이면 스무딩 없이 새 방향 사용
@@ -554,54 +577,80 @@ class EmulatorManager:
                 else:
                     angle = prev_angle  # 이동이 없으면 이전 방향 유지
 
-                # 생성된 데이터 저장
-                data_point = {
-                    "timestamp": current_time,
-                    "latitude": self.last_latitude,
-                    "longitude": self.last_longitude,
-                    "speed": speed,  # 계산된 속도 (km/h)
-                    "angle": angle,  # 계산된 방향각
-                    "battery": random.uniform(70, 100),  # 배터리 레벨
-                }
-
-                self.collecting_data.append(data_point)
+                # 생성된 데이터 저장 (항목별 배열에 추가)
+                self.collecting_data.append(
+                    current_time,
+                    self.last_latitude,
+                    self.last_longitude,
+                    speed,  # 계산된 속도 (km/h)
+                    angle,  # 계산된 방향각
+                    70.0 + 30.0 * random_value()  # 배터리 레벨 (70~100)
+                )
                 count += 1
 
                 # 이전 값 업데이트
                 prev_lat = self.last_latitude
                 prev_lon = self.last_longitude
-                prev_time = current_time
+                prev_tick = current_tick
                 prev_speed = speed
                 prev_angle = angle
 
                 # 전송 주기에 도달하거나 배치 크기에 도달하면 콜백 함수 호출
-                time_since_last_send = (current_time - last_send_time).total_seconds()
+                time_since_last_send = current_tick - last_send_tick
                 if ((time_since_last_send >= send_interval_sec) or (count >= batch_size)) and self.data_callback and callable(self.data_callback):
                     # 마지막 데이터 포인트 저장
                     if self.collecting_data:
                         self.last_gps_batch_data = self.collecting_data[-1]
-                        print(f"[DEBUG] 마지막 GPS 주기정보 데이터 저장 - MDN: {self.mdn}, 좌표: ({self.last_gps_batch_data['latitude']}, {self.last_gps_batch_data['longitude']})")
+                        self.log.debug("마지막 GPS 주기정보 데이터 저장 - 좌표: (%s, %s)", self.last_gps_batch_data['latitude'], self.last_gps_batch_data['longitude'])
 
-                    self.data_callback(self.mdn, self.collecting_data)
-                    self.collecting_data = []
+                    self.data_callback(self.mdn, self._take_collected_data())
                     count = 0
-                    last_send_time = current_time
+                    last_send_tick = current_tick
 
-            # 다음 생성 시기까지 대기
-            time.sleep(interval_sec)
+            # 다음 생성 시각까지 대기 (중지 신호가 오면 즉시 종료)
+            remaining = next_deadline - time.monotonic()
+            if remaining > 0 and stop_event.wait(remaining):
+                break
+            next_deadline += interval_sec
 
-    def get_emulator_data(self) -> Optional[VehicleData]:
+            # 작업이 주기를 넘겨 마감 시각이 지났으면 밀린 주기를 몰아서 실행하지 않고 다음 마감 시각으로 건너뜀
+            now_tick = time.monotonic()
+            if next_deadline <= now_tick and interval_sec > 0:
+                next_deadline += ((now_tick - next_deadline) // interval_sec + 1) * interval_sec
+
+    def _take_collected_data(self) -> GpsSampleBuffer:
+        """
+        수집된 배치를 꺼내고 다음 배치용 버퍼를 배치 크기만큼 미리 할당
+
+        Returns:
+            GpsSampleBuffer: 포인트 수에 맞게 잘라낸 수집 배치
         """
-        에뮬레이터의 현재 데이터 가져오기
+        collected = self.collecting_data
+        self.collecting_data = GpsSampleBuffer(self.collect_batch_size)
+        return collected.trim()
+
+    def advance_and_snapshot(self) -> Optional[VehicleData]:
+        """
+        경로를 한 포인트 진행한 뒤 에뮬레이터의 현재 데이터 가져오기
+        실시간 수집 스레드가 동작 중일 때는 위치 진행이 중복되므로 get_emulator_data를 사용합니다.
         """
         if not self.is_active:
             return None
 
-        if self.is_active:
-            # 카카오 API 경로 데이터를 사용하여 위치 업데이트
-            self.update_position()
+        # 카카오 API 경로 데이터를 사용하여 위치 업데이트
+        self.update_position()
+        return self.get_emulator_data()
 
-            # 마지막 위치 정보는 update_position 메서드에서 업데이트됨
+    def get_emulator_data(self) -> Optional[VehicleData]:
+        """
+        에뮬레이터의 현재 데이터 가져오기 (위치는 진행하지 않음)
+        위치 진행은 실시간 수집 스레드(또는 advance_and_snapshot)만 수행합니다.
+        """
+        if not self.is_active:
+            return None
+
+        # 난수 함수는 한 번만 조회해 재사용
+        random_value = random.random
 
         return VehicleData(
             mdn=self.mdn,
@@ -612,34 +661,58 @@ class EmulatorManager:
             device_firmware_version=self.device_firmware_version,
             latitude=self.last_latitude,
             longitude=self.last_longitude,
-            speed=random.uniform(0, 80) if self.is_active else 0,
-            heading=random.randint(0, 359) if self.is_active else 0,
-            battery_level=random.uniform(50, 100),
-            engine_temperature=random.uniform(70, 95) if self.is_active else random.uniform(20, 30),
+            # random.uniform/randint 대신 random.random 한 번으로 범위 값 생성 (여기서는 항상 활성 상태)
+            speed=80.0 * random_value(),
+            heading=int(360 * random_value()),
+            battery_level=50.0 + 50.0 * random_value(),
+            engine_temperature=70.0 + 25.0 * random_value(),
             timestamp=datetime.now()
         )
 
     def get_emulator_dict(self) -> Dict[str, Any]:
         """
         에뮬레이터 정보를 딕셔너리로 반환 (이전 버전과의 호환성을 위함)
+        매번 새 딕셔너리를 만들지 않고 같은 딕셔너리를 현재 상태로 갱신해 반환하므로,
+        호출자는 읽기 전용으로 사용해야 합니다. (상태 변경은 매니저 메서드 사용)
 
         Returns:
             Dict[str, Any]: 에뮬레이터 정보 딕셔너리
         """
-        return {
-            "mdn": self.mdn,
-            "terminal_id": self.terminal_id,
-            "manufacture_id": self.manufacture_id,
-            "packet_version": self.packet_version,
-            "device_id": self.device_id,
-            "device_firmware_version": self.device_firmware_version,
-            "last_latitude": self.last_latitude,
-            "last_longitude": self.last_longitude,
-            "is_active": self.is_active,
-            "last_update": self.last_update,
-            "accumulated_distance": self.accumulated_distance,
-            "last_power_on_time": getattr(self, "last_power_on_time", "")
-        }
+        emulator = self.emulator_dict
+        emulator["mdn"] = self.mdn
+        emulator["terminal_id"] = self.terminal_id
+        emulator["manufacture_id"] = self.manufacture_id
+        emulator["packet_version"] = self.packet_version
+        emulator["device_id"] = self.device_id
+        emulator["device_firmware_version"] = self.device_firmware_version
+        emulator["last_latitude"] = self.last_latitude
+        emulator["last_longitude"] = self.last_longitude
+        emulator["is_active"] = self.is_active
+        emulator["last_update"] = self.last_update
+        emulator["accumulated_distance"] = self.accumulated_distance
+        emulator["last_power_on_time"] = self.last_power_on_time
+        return emulator
+
+    @property
+    def active_emulators(self) -> Dict[str, Dict[str, Any]]:
+        """
+        이전 버전과의 호환성을 위한 {MDN: 에뮬레이터 정보} 딕셔너리
+        상태가 바뀔 때마다 다시 만들지 않고, 읽을 때 현재 상태로 구성합니다.
+        MDN이 없거나 에뮬레이터가 활성 상태가 아니면 빈 딕셔너리를 반환합니다.
+        """
+        if self.mdn is None or not self.is_active:
+            return {}
+        return {self.mdn: self.get_emulator_dict()}
+
+    def set_active(self, mdn: str, active: bool) -> None:
+        """
+        에뮬레이터 활성 상태 설정
+
+        Args:
+            mdn: 차량 번호 (단말기 번호) (무시됨)
+            active: 활성 상태 (True: 시동 ON, False: 시동 OFF)
+        """
+        self.is_active = active
 
     def is_emulator_exists(self, mdn: str = None) -> bool:
         """
@@ -679,7 +752,7 @@ class EmulatorManager:
         # 더 이상 백엔드 API 직접 호출 없이 로그만 남김 (제거된 기능)
 
         # 로그만 출력    
-        print(f"[INFO] 차량 전원 상태 업데이트 로그: MDN={self.mdn}, powerOn={power_on} (API 호출 없음)")
+        self.log.info("차량 전원 상태 업데이트 로그: powerOn=%s (API 호출 없음)", power_on)
         return True, "전원 상태 업데이트 성공 (로그만 기록)"
 
     def update_emulator_position(self, latitude: float, longitude: float, distance: float = 0) -> bool:
@@ -701,18 +774,12 @@ class EmulatorManager:
             # MDN별 누적 거리 딕셔너리 업데이트
             self.mdn_accumulated_distances[self.mdn] = self.accumulated_distance
 
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.active_emulators = {self.mdn: self.get_emulator_dict()}
-
-        # 마지막 위치 정보 업데이트
-        self.last_positions[self.mdn] = {
-            "latitude": self.last_latitude,
-            "longitude": self.last_longitude,
-            "timestamp": datetime.now()
-        }
+        # 마지막 위치 정보 업데이트 (위치 갱신 시각과 동일)
+        self.update_last_positions(self.last_latitude, self.last_longitude, self.last_update)
 
         return True
 
+    @require_own_mdn(0)
     def get_accumulated_distance(self, mdn: str = None) -> int:
         """
         누적 주행거리 조회 (미터)
@@ -720,12 +787,9 @@ class EmulatorManager:
         Args:
             mdn: 차량 번호 (단말기 번호), 기본값은 None (무시됨)
         """
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn is not None and mdn != self.mdn:
-            return 0
-
         return self.accumulated_distance
 
+    @require_own_mdn(False)
     def update_accumulated_distance(self, distance: int, mdn: str = None) -> bool:
         """
         누적 주행거리 업데이트 (미터)
@@ -737,19 +801,13 @@ class EmulatorManager:
         Returns:
             bool: 성공 여부
         """
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn is not None and mdn != self.mdn:
-            return False
-
         self.accumulated_distance = distance
         # MDN별 누적 거리 딕셔너리 업데이트
         self.mdn_accumulated_distances[self.mdn] = distance
 
-        # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-        self.active_emulators = {self.mdn: self.get_emulator_dict()}
-
         return True
 
+    @require_own_mdn(False)
     def update_location(self, latitude: float, longitude: float, mdn: str = None) -> bool:
         """
         단말기 위치 정보 업데이트
@@ -762,12 +820,44 @@ class EmulatorManager:
         Returns:
             bool: 성공 여부
         """
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn is not None and mdn != self.mdn:
-            return False
-
         return self.update_emulator_position(latitude, longitude)
 
+    def save_last_position(self, timestamp: Optional[datetime] = None) -> None:
+        """
+        현재 좌표를 마지막 위치로 저장
+        백엔드 형식(좌표 x 1,000,000 정수 문자열)도 이때 한 번만 변환해 둡니다.
+
+        Args:
+            timestamp: 기록 시각, 기본값은 None (현재 시각 사용)
+        """
+        last_position = self.last_position
+        last_position["latitude"] = self.last_latitude
+        last_position["longitude"] = self.last_longitude
+        last_position["timestamp"] = timestamp if timestamp is not None else datetime.now()
+        self.last_position_fixed = (
+            str(int(self.last_latitude * 1000000)),
+            str(int(self.last_longitude * 1000000))
+        )
+
+    def update_last_positions(self, latitude: float, longitude: float, timestamp: Optional[datetime] = None, mdn: str = None) -> None:
+        """
+        MDN별 마지막 위치 갱신 (새 딕셔너리를 만들지 않고 기존 항목을 제자리에서 갱신)
+
+        Args:
+            latitude: 위도
+            longitude: 경도
+            timestamp: 기록 시각, 기본값은 None (현재 시각 사용)
+            mdn: 차량 번호(MDN), 기본값은 None (현재 에뮬레이터의 MDN 사용)
+        """
+        key = mdn or self.mdn
+        position = self.last_positions.get(key)
+        if position is None:
+            position = self.last_positions[key] = {}
+        position["latitude"] = latitude
+        position["longitude"] = longitude
+        position["timestamp"] = timestamp if timestamp is not None else datetime.now()
+
+    @require_own_mdn(None)
     def get_last_position(self, mdn: str = None) -> dict:
         """
         마지막 위치 정보 가져오기 (시동 OFF 시 저장한 위치)
@@ -778,21 +868,39 @@ class EmulatorManager:
         Returns:
             dict: 마지막 위치 정보 또는 None
         """
-        # 요청된 MDN이 현재 에뮬레이터의 MDN과 일치하는지 확인
-        if mdn is not None and mdn != self.mdn:
-            return None
-
-        # 위치 데이터에 좌표가 있는 경우 문자열로 변환
-        heading = str(random.randint(0, 359))
-        accumulated_distance = str(self.accumulated_distance)
+        # 좌표는 저장 시 변환해 둔 문자열 사용 (Java 백엔드 형식에 맞춰서 1,000,000 곱한 값)
+        latitude, longitude = self.last_position_fixed
 
         return {
-            "latitude": str(int(self.last_position["latitude"] * 1000000)),  # Java 백엔드 형식에 맞춰서 1,000,000 곱하기
-            "longitude": str(int(self.last_position["longitude"] * 1000000)),
-            "heading": heading,
-            "accumulated_distance": accumulated_distance
+            "latitude": latitude,
+            "longitude": longitude,
+            "heading": str(int(360 * random.random())),
+            "accumulated_distance": str(self.accumulated_distance)
         }
 
+    def _build_route_segments(self, route_points: List[Dict]) -> None:
+        """
+        경로 좌표 배열과 구간별 거리/방위각을 한 번에 계산해 저장 (실시간 수집 틱에서는 인덱스로 조회만 함)
+
+        Args:
+            route_points: 경로 포인트 목록 [{"latitude": float, "longitude": float}, ...]
+        """
+        latitudes = array("d", [point["latitude"] for point in route_points])
+        longitudes = array("d", [point["longitude"] for point in route_points])
+
+        distances = array("d", [0.0])
+        bearings = array("d", [0.0])
+        for lat1, lon1, lat2, lon2 in zip(latitudes, longitudes, latitudes[1:], longitudes[1:]):
+            distance, bearing = distance_and_bearing(lat1, lon1, lat2, lon2)
+            distances.append(distance)
+            bearings.append(bearing)
+
+        self.route_length = len(route_points)
+        self.route_latitudes = latitudes
+        self.route_longitudes = longitudes
+        self.route_segment_distances = distances
+        self.route_segment_bearings = bearings
+
     def set_kakao_route_data(self, route_points: List[Dict]) -> bool:
         """
         카카오 API 경로 데이터 설정
@@ -803,34 +911,36 @@ class EmulatorManager:
         Returns:
             bool: 성공 여부
         """
-        print(f"[DEBUG] 카카오 API 경로 데이터 설정 시작 - MDN: {self.mdn}, 포인트 수: {len(route_points) if route_points else 0}")
+        self.log.debug("카카오 API 경로 데이터 설정 시작 - 포인트 수: %s", len(route_points) if route_points else 0)
 
         if not route_points:
-            print(f"[ERROR] 경로 포인트가 없습니다 - MDN: {self.mdn}")
+            self.log.error("경로 포인트가 없습니다")
             return False
 
         # 경로 데이터 유효성 검사
         valid_points = True
         for i, point in enumerate(route_points[:5]):  # 처음 5개 포인트만 로깅
             if "latitude" not in point or "longitude" not in point:
-                print(f"[ERROR] 유효하지 않은 경로 포인트 형식 - 인덱스: {i}, 포인트: {point}")
+                self.log.error("유효하지 않은 경로 포인트 형식 - 인덱스: %s, 포인트: %s", i, point)
                 valid_points = False
                 break
 
         if not valid_points:
-            print(f"[ERROR] 유효하지 않은 경로 포인트가 포함되어 있습니다 - MDN: {self.mdn}")
+            self.log.error("유효하지 않은 경로 포인트가 포함되어 있습니다")
             return False
 
         # 경로 데이터 설정
-        print(f"[DEBUG] 경로 데이터 설정 중 - 이전 포인트 수: {len(self.kakao_route_points) if self.kakao_route_points else 0}, 새 포인트 수: {len(route_points)}")
+        self.log.debug("경로 데이터 설정 중 - 이전 포인트 수: %s, 새 포인트 수: %s", len(self.kakao_route_points) if self.kakao_route_points else 0, len(route_points))
         self.kakao_route_points = route_points
         self.current_route_index = 0
-        print(f"[DEBUG] 경로 데이터 설정 완료 - 현재 인덱스: {self.current_route_index}")
+        self.route_finalized = False
+        self._build_route_segments(route_points)
+        self.log.debug("경로 데이터 설정 완료 - 현재 인덱스: %s", self.current_route_index)
 
         # 첫 번째 포인트로 위치 초기화
         if len(route_points) > 0:
             first_point = route_points[0]
-            print(f"[DEBUG] 첫 번째 포인트로 위치 초기화 - 좌표: ({first_point['latitude']}, {first_point['longitude']})")
+            self.log.debug("첫 번째 포인트로 위치 초기화 - 좌표: (%s, %s)", first_point['latitude'], first_point['longitude'])
 
             # 이전 위치 저장 (디버깅용)
             prev_lat = self.last_latitude
@@ -840,15 +950,11 @@ class EmulatorManager:
             self.last_latitude = first_point["latitude"]
             self.last_longitude = first_point["longitude"]
 
-            print(f"[DEBUG] 위치 업데이트 - 이전: ({prev_lat}, {prev_lon}), 새 위치: ({self.last_latitude}, {self.last_longitude})")
+            self.log.debug("위치 업데이트 - 이전: (%s, %s), 새 위치: (%s, %s)", prev_lat, prev_lon, self.last_latitude, self.last_longitude)
 
             # 마지막 위치 정보 업데이트
-            self.last_positions[self.mdn] = {
-                "latitude": self.last_latitude,
-                "longitude": self.last_longitude,
-                "timestamp": datetime.now()
-            }
-            print(f"[DEBUG] 마지막 위치 정보 업데이트 완료 - MDN: {self.mdn}")
-
-        print(f"[INFO] 카카오 API 경로 데이터 설정 완료: {len(route_points)}개 포인트 - MDN: {self.mdn}")
+            self.update_last_positions(self.last_latitude, self.last_longitude)
+            self.log.debug("마지막 위치 정보 업데이트 완료")
+
+        self.log.info("카카오 API 경로 데이터 설정 완료: %s개 포인트", len(route_points))
         return True
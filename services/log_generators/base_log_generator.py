@@ -3,11 +3,20 @@
 모든 로그 타입별 생성기가 상속받는 기본 클래스
 """
 
-from abc import ABC, abstractmethod
-import math
+from abc import ABC
 from typing import Dict, Any, Optional
 
-from services.emulator_manager import EmulatorManager
+from services.emulator_manager import EmulatorManager, distance_and_bearing
+
+# 로그 공통 헤더 값 (모든 로그 생성기가 같은 문자열 객체를 공유)
+# API 규격: tid는 차량관제에서 'A001'로 고정
+TERMINAL_ID = "A001"
+# API 규격: mid는 CNSLink는 '6' 값 사용
+MANUFACTURE_ID = "6"
+# API 규격: pv는 M2M 버전이 5이므로 '5'로 고정
+PACKET_VERSION = "5"
+# API 규격: did는 GPS로만 운영함으로 '1'로 고정
+DEVICE_ID = "1"
 
 class BaseLogGenerator(ABC):
     """로그 생성기의 기본 추상 클래스"""
@@ -21,7 +30,8 @@ class BaseLogGenerator(ABC):
         """
         self.emulator_manager = emulator_manager
 
-    def calculate_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    @staticmethod
+    def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
         두 지점 간의 거리를 미터 단위로 계산 (Haversine 공식)
 
@@ -34,16 +44,8 @@ class BaseLogGenerator(ABC):
         Returns:
             float: 거리(미터)
         """
-        R = 6371000  # 지구 반경 (미터)
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        delta_phi = math.radians(lat2 - lat1)
-        delta_lambda = math.radians(lon2 - lon1)
-
-        a = math.sin(delta_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        distance = R * c
-
+        # Haversine 계산은 emulator_manager.distance_and_bearing 한 곳에서만 구현
+        distance, _ = distance_and_bearing(lat1, lon1, lat2, lon2)
         return distance
 
     def is_emulator_active(self, mdn: str) -> bool:
@@ -70,8 +72,5 @@ class BaseLogGenerator(ABC):
         """
         if not self.is_emulator_active(mdn):
             return None
-        # 단일 에뮬레이터 모드에서는 active_emulators에서 가져옴
-        if mdn in self.emulator_manager.active_emulators:
-            return self.emulator_manager.active_emulators[mdn]
-        # 호환성을 위해 에뮬레이터 딕셔너리 생성
+        # 단일 에뮬레이터 모드 - 활성 상태 확인으로 MDN 일치가 보장되므로 현재 상태를 바로 딕셔너리로 구성
         return self.emulator_manager.get_emulator_dict()
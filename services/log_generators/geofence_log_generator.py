@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Dict, Any, Optional
 
 from models.emulator_data import GeofenceLogRequest
-from services.log_generators.base_log_generator import BaseLogGenerator
+from services.log_generators.base_log_generator import BaseLogGenerator, TERMINAL_ID, MANUFACTURE_ID, PACKET_VERSION, DEVICE_ID
 
 class GeofenceLogGenerator(BaseLogGenerator):
     """지오펜스 로그 데이터 생성 담당 클래스"""
@@ -62,14 +62,11 @@ class GeofenceLogGenerator(BaseLogGenerator):
         # 지오펜스 로그 요청 생성
         geofence_log = GeofenceLogRequest(
             mdn=mdn,
-            # API 규격: tid는 차량관제에서 'A001'로 고정
-            tid="A001",
-            # API 규격: mid는 CNSLink는 '6' 값 사용
-            mid="6",
-            # API 규격: pv는 M2M 버전이 5이므로 '5'로 고정
-            pv="5",
-            # API 규격: did는 GPS로만 운영함으로 '1'로 고정
-            did="1",
+            # API 규격 고정 헤더 값
+            tid=TERMINAL_ID,
+            mid=MANUFACTURE_ID,
+            pv=PACKET_VERSION,
+            did=DEVICE_ID,
             oTime=time_str,
             geoGrpId=geo_grp_id,
             geoPId=geo_p_id,
@@ -3,12 +3,15 @@
 차량 시동 ON/OFF 관련 로그 데이터를 생성하는 클래스
 """
 
+import logging
 import random
 from datetime import datetime
 from typing import Dict, Any, Optional
 
 from models.emulator_data import PowerLogRequest
-from services.log_generators.base_log_generator import BaseLogGenerator
+from services.log_generators.base_log_generator import BaseLogGenerator, TERMINAL_ID, MANUFACTURE_ID, PACKET_VERSION, DEVICE_ID
+
+logger = logging.getLogger(__name__)
 
 class PowerLogGenerator(BaseLogGenerator):
     """시동 로그 데이터 생성 담당 클래스
@@ -81,18 +84,18 @@ class PowerLogGenerator(BaseLogGenerator):
                 last_gps_data = self.emulator_manager.collecting_data[-1]
                 lat = last_gps_data["latitude"]
                 lon = last_gps_data["longitude"]
-                print(f"[INFO] 시동 OFF 로그에 현재 수집 중인 데이터의 마지막 포인트 위치 사용: ({lat}, {lon})")
+                logger.info("시동 OFF 로그에 현재 수집 중인 데이터의 마지막 포인트 위치 사용: (%s, %s)", lat, lon)
             # 마지막 GPS 주기정보가 있으면 해당 위치 사용
             elif self.emulator_manager.last_gps_batch_data and "latitude" in self.emulator_manager.last_gps_batch_data and "longitude" in self.emulator_manager.last_gps_batch_data:
                 last_gps_data = self.emulator_manager.last_gps_batch_data
                 lat = last_gps_data["latitude"]
                 lon = last_gps_data["longitude"]
-                print(f"[INFO] 시동 OFF 로그에 마지막 GPS 주기정보 위치 사용: ({lat}, {lon})")
+                logger.info("시동 OFF 로그에 마지막 GPS 주기정보 위치 사용: (%s, %s)", lat, lon)
             else:
                 # 마지막 GPS 주기정보가 없으면 현재 위치 사용
                 lat = emulator["last_latitude"]
                 lon = emulator["last_longitude"]
-                print(f"[INFO] 시동 OFF 로그에 현재 위치 사용: ({lat}, {lon})")
+                logger.info("시동 OFF 로그에 현재 위치 사용: (%s, %s)", lat, lon)
 
             # GPS 상태 결정 (random으로 95% 정상 처리)
             is_gps_normal = random.random() < 0.95
@@ -102,31 +105,31 @@ class PowerLogGenerator(BaseLogGenerator):
             # 현재 수집 중인 데이터가 있으면 마지막 데이터 포인트의 속도 사용
             if hasattr(self.emulator_manager, "collecting_data") and self.emulator_manager.collecting_data and len(self.emulator_manager.collecting_data) > 0 and "speed" in self.emulator_manager.collecting_data[-1]:
                 spd = str(int(self.emulator_manager.collecting_data[-1]["speed"]))
-                print(f"[INFO] 시동 OFF 로그에 현재 수집 중인 데이터의 마지막 포인트 속도 사용: {spd}")
+                logger.info("시동 OFF 로그에 현재 수집 중인 데이터의 마지막 포인트 속도 사용: %s", spd)
             # 마지막 GPS 주기정보가 있으면 해당 속도 사용
             elif last_gps_data and "speed" in last_gps_data:
                 spd = str(int(last_gps_data["speed"]))
-                print(f"[INFO] 시동 OFF 로그에 마지막 GPS 주기정보 속도 사용: {spd}")
+                logger.info("시동 OFF 로그에 마지막 GPS 주기정보 속도 사용: %s", spd)
             else:
                 spd = str(random.randint(0, 100))  # 현실적인 속도 범위로 조정
-                print(f"[INFO] 시동 OFF 로그에 랜덤 속도 사용: {spd}")
+                logger.info("시동 OFF 로그에 랜덤 속도 사용: %s", spd)
 
         # 방향각 (규격: 0~365)
         if not power_on:
             # 현재 수집 중인 데이터가 있으면 마지막 데이터 포인트의 방향각 사용
             if hasattr(self.emulator_manager, "collecting_data") and self.emulator_manager.collecting_data and len(self.emulator_manager.collecting_data) > 0 and "angle" in self.emulator_manager.collecting_data[-1]:
                 ang = str(int(self.emulator_manager.collecting_data[-1]["angle"]))
-                print(f"[INFO] 시동 OFF 로그에 현재 수집 중인 데이터의 마지막 포인트 방향각 사용: {ang}")
+                logger.info("시동 OFF 로그에 현재 수집 중인 데이터의 마지막 포인트 방향각 사용: %s", ang)
             # 마지막 GPS 주기정보가 있으면 해당 방향각 사용
             elif self.emulator_manager.last_gps_batch_data and "angle" in self.emulator_manager.last_gps_batch_data:
                 ang = str(int(self.emulator_manager.last_gps_batch_data["angle"]))
-                print(f"[INFO] 시동 OFF 로그에 마지막 GPS 주기정보 방향각 사용: {ang}")
+                logger.info("시동 OFF 로그에 마지막 GPS 주기정보 방향각 사용: %s", ang)
             else:
                 ang = str(random.randint(0, 365))
-                print(f"[INFO] 시동 OFF 로그에 랜덤 방향각 사용: {ang}")
+                logger.info("시동 OFF 로그에 랜덤 방향각 사용: %s", ang)
         else:
             ang = str(random.randint(0, 365))
-            print(f"[INFO] 시동 ON 로그에 랜덤 방향각 사용: {ang}")
+            logger.info("시동 ON 로그에 랜덤 방향각 사용: %s", ang)
 
         # 시동 ON/OFF 시간 처리
         on_time = ""
@@ -139,8 +142,6 @@ class PowerLogGenerator(BaseLogGenerator):
             # 시동 ON 시간 저장 (향후 시동 OFF 시 필요)
             # 단일 에뮬레이터 모드에서는 직접 속성으로 저장
             self.emulator_manager.last_power_on_time = time_str
-            # 이전 버전과의 호환성을 위한 active_emulators 업데이트
-            self.emulator_manager.active_emulators = {mdn: self.emulator_manager.get_emulator_dict()}
         else:
             # 시동 OFF 시간 및 직전 시동 ON 시간 설정
             off_time = time_str
@@ -153,7 +154,7 @@ class PowerLogGenerator(BaseLogGenerator):
                 # 시동 ON 시간이 없는 경우 현재 시간에서 1시간 전으로 설정 (임의의 값)
                 from datetime import timedelta
                 on_time = (datetime.now() - timedelta(hours=1)).strftime("%Y%m%d%H%M%S")
-                print(f"[WARNING] 시동 ON 시간이 없어 임의 값으로 설정: {on_time}")
+                logger.warning("시동 ON 시간이 없어 임의 값으로 설정: %s", on_time)
 
         # 위도/경도 값을 소수점 6자리로 제한하고 1,000,000 곱하기
         lat_value = round(lat, 6)
@@ -162,14 +163,11 @@ class PowerLogGenerator(BaseLogGenerator):
         # 시동 로그 요청 생성
         power_log = PowerLogRequest(
             mdn=mdn,
-            # API 규격: tid는 차량관제에서 'A001'로 고정
-            tid="A001",
-            # API 규격: mid는 CNSLink는 '6' 값 사용
-            mid="6",
-            # API 규격: pv는 M2M 버전이 5이므로 '5'로 고정
-            pv="5",
-            # API 규격: did는 GPS로만 운영함으로 '1'로 고정
-            did="1",
+            # API 규격 고정 헤더 값
+            tid=TERMINAL_ID,
+            mid=MANUFACTURE_ID,
+            pv=PACKET_VERSION,
+            did=DEVICE_ID,
             # 시동 ON/OFF 시간
             onTime=on_time,
             offTime=off_time,
@@ -183,22 +181,13 @@ class PowerLogGenerator(BaseLogGenerator):
             sum=sum_val
         )
 
-        # 시동 상태 업데이트
-        emulator["is_active"] = power_on
-
         # 시동 OFF 시 현재 위치 저장 (향후 시동 ON시 사용)
         if not power_on:
-            self.emulator_manager.last_positions[mdn] = {
-                "latitude": emulator["last_latitude"],
-                "longitude": emulator["last_longitude"],
-                "timestamp": current_time
-            }
+            self.emulator_manager.update_last_positions(emulator["last_latitude"], emulator["last_longitude"], current_time, mdn)
 
-            # 시동 OFF 시 최신 누적 거리 가져오기
+            # 시동 OFF 시 최신 누적 거리를 정수(미터)로 확정해 에뮬레이터 매니저에 업데이트
+            # (로그는 이미 생성되었으므로 문자열 변환은 하지 않음)
             total_distance = self.emulator_manager.get_accumulated_distance(mdn)
-            sum_val = str(int(total_distance))
-
-            # 에뮬레이터 매니저에 최종 누적 거리 업데이트
             self.emulator_manager.update_accumulated_distance(int(total_distance), mdn)
 
         return power_log
@@ -221,10 +210,10 @@ class PowerLogGenerator(BaseLogGenerator):
 
         if is_power_on:
             # 시동 ON 처리
-            print(f"[INFO] 차량 {mdn} 시동 ON 처리 (시간: {log_data.onTime})")
+            logger.info("차량 %s 시동 ON 처리 (시간: %s)", mdn, log_data.onTime)
         else:
             # 시동 OFF 처리
-            print(f"[INFO] 차량 {mdn} 시동 OFF 처리 (시간: {log_data.offTime}, 누적 거리: {log_data.sum}m)")
+            logger.info("차량 %s 시동 OFF 처리 (시간: %s, 누적 거리: %sm)", mdn, log_data.offTime, log_data.sum)
 
         # 로그 처리 성공 여부 반환 (실제 저장은 EmulatorDataGenerator에서 수행)
         return True
@@ -4,19 +4,69 @@
 """
 
 import abc
-import queue
+import itertools
+import json
+import logging
 import threading
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, Tuple, Optional, Union
+from typing import Tuple, Optional, Union, List, Callable
 
 from models.emulator_data import GpsLogRequest, PowerLogRequest, GeofenceLogRequest
 
+logger = logging.getLogger(__name__)
+
+# 백엔드 연결 풀 설정 (호스트별 풀 수, 풀당 유지할 최대 연결 수)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 16
+
+
+def create_http_session():
+    """
+    백엔드 전송용 HTTP 세션 생성
+    연결을 keep-alive로 재사용하고, 연결 오류와 GET 요청의 502/503/504 응답은 짧은 백오프로 최대 3회 재시도합니다.
+    로그 POST는 서버에 이미 저장되었을 수 있으므로 응답 상태나 읽기 오류로 재전송하지 않습니다
+    (중복 전송 방지, 실패한 로그는 process_pending_logs가 대기열에 다시 넣어 재전송).
+
+    Returns:
+        requests.Session: 연결 풀이 설정된 세션
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=3,
+        read=0,  # 응답 대기 중 타임아웃 등은 재전송하지 않음
+        other=0,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        allowed_methods=frozenset({"GET"}),  # POST는 연결 오류(요청 미전송)만 재시도
+        raise_on_status=False  # 재시도 후에도 실패하면 마지막 응답을 그대로 반환
+    )
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
 class BaseLogHandler(abc.ABC):
     """로그 처리를 위한 기본 추상 클래스"""
 
+    # 일괄 전송 시 한 번의 요청에 담을 최대 로그 수
+    max_batch_size = 64
+
+    # 모든 전송 요청에 공통으로 사용하는 헤더 (요청마다 새로 만들지 않음)
+    REQUEST_HEADERS = {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+        'User-Agent': 'ThiswayVehicleEmulator/1.0'
+    }
+
     def __init__(self, log_type: str, max_storage_hours: int = 24, backend_url: str = "http://localhost:8080",
-                 use_auth: bool = False, auth_username: str = "", auth_password: str = ""):
+                 use_auth: bool = False, auth_username: str = "", auth_password: str = "", session=None):
         """
         로그 핸들러 초기화
 
@@ -27,9 +77,11 @@ class BaseLogHandler(abc.ABC):
             use_auth: 인증 사용 여부
             auth_username: 인증 사용자명
             auth_password: 인증 비밀번호
+            session: 전송에 사용할 HTTP 세션 (None이면 핸들러 전용 세션 생성)
         """
         # 해당 로그 타입에 대한 미전송 로그를 저장하는 큐 (MDN별)
-        self.pending_logs = {}  # MDN -> Queue
+        # 모든 접근이 queue_lock 안에서 이루어지므로 자체 락이 없는 deque 사용
+        self.pending_logs = {}  # MDN -> deque
         # 큐 액세스를 위한 락
         self.queue_lock = threading.Lock()
         # 최대 저장 시간 (기본 24시간)
@@ -38,10 +90,21 @@ class BaseLogHandler(abc.ABC):
         self.backend_url = backend_url
         # 로그 타입
         self.log_type = log_type
+        # 전송 URL (초기화 시 한 번만 구성)
+        self.endpoint_url = f"{backend_url}{self.backend_endpoint}"
+        self.batch_endpoint_url = f"{backend_url}{self.batch_endpoint}" if self.batch_endpoint else None
+        # 연결을 재사용하는 HTTP 세션 (요청마다 TCP 연결을 새로 맺지 않음)
+        self.session = session if session is not None else create_http_session()
         # 인증 정보
         self.use_auth = use_auth
         self.auth_username = auth_username
         self.auth_password = auth_password
+        # 로그 적재 시 백그라운드 전송 스레드를 깨우는 콜백 (설정된 경우 즉시 전송 대신 대기열에 적재)
+        self.notify_callback: Optional[Callable[[], None]] = None
+        # 일괄 전송 엔드포인트 지원 여부 (404/405 응답 시 개별 전송으로 전환)
+        self.batch_supported = True
+        # 마지막 미전송 로그 처리에서 전송에 실패한 로그 수 (queue_lock 안에서 갱신)
+        self.last_failed_count = 0
 
     @property
     @abc.abstractmethod
@@ -49,6 +112,11 @@ class BaseLogHandler(abc.ABC):
         """백엔드 API 엔드포인트"""
         pass
 
+    @property
+    def batch_endpoint(self) -> Optional[str]:
+        """일괄 전송 API 엔드포인트 (None이면 개별 전송만 사용)"""
+        return None
+
     def has_pending_logs(self, mdn: str) -> bool:
         """
         미전송 로그가 있는지 확인
@@ -60,7 +128,7 @@ class BaseLogHandler(abc.ABC):
             bool: 미전송 로그 존재 여부
         """
         with self.queue_lock:
-            return mdn in self.pending_logs and not self.pending_logs[mdn].empty()
+            return bool(self.pending_logs.get(mdn))
 
     def count_pending_logs(self, mdn: str) -> int:
         """
@@ -73,13 +141,24 @@ class BaseLogHandler(abc.ABC):
             int: 미전송 로그 개수
         """
         with self.queue_lock:
-            if mdn not in self.pending_logs:
-                return 0
-            return self.pending_logs[mdn].qsize()
+            pending = self.pending_logs.get(mdn)
+            return len(pending) if pending is not None else 0
+
+    def count_all_pending_logs(self) -> int:
+        """
+        모든 MDN의 미전송 로그 개수 합계
+
+        Returns:
+            int: 미전송 로그 개수
+        """
+        with self.queue_lock:
+            return sum(map(len, self.pending_logs.values()))
 
     def store_log(self, mdn: str, log_data: Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest]) -> bool:
         """
-        로그 데이터를 저장하고 즉시 전송 시도
+        로그 데이터를 저장하고 전송
+        백그라운드 전송 스레드가 연결된 경우 대기열에 적재 후 스레드를 깨워 일괄 전송하고,
+        그렇지 않으면 즉시 전송을 시도합니다.
 
         Args:
             mdn: 차량 번호(MDN)
@@ -88,33 +167,54 @@ class BaseLogHandler(abc.ABC):
         Returns:
             bool: 저장 성공 여부
         """
+        notify_callback = self.notify_callback
+        if notify_callback is not None:
+            pending_count = self._enqueue_log(mdn, log_data)
+            logger.debug("%s 로그 전송 대기열 적재 - MDN: %s, 대기 로그: %s개", self.log_type, mdn, pending_count)
+            notify_callback()
+            return True
+
         # 즉시 전송 시도
-        print(f"[INFO] {self.log_type} 로그 즉시 전송 시도 - MDN: {mdn}")
+        logger.info("%s 로그 즉시 전송 시도 - MDN: %s", self.log_type, mdn)
         success, error_msg = self.send_log_to_backend(log_data)
 
         if success:
-            print(f"[SUCCESS] {self.log_type} 로그 즉시 전송 성공 - MDN: {mdn}")
+            logger.info("%s 로그 즉시 전송 성공 - MDN: %s", self.log_type, mdn)
             return True
         else:
-            print(f"[WARNING] {self.log_type} 로그 즉시 전송 실패 - MDN: {mdn}, 오류: {error_msg}")
-            print(f"[INFO] 실패한 로그를 대기열에 저장합니다 - MDN: {mdn}")
+            logger.warning("%s 로그 즉시 전송 실패 - MDN: %s, 오류: %s", self.log_type, mdn, error_msg)
+            logger.info("실패한 로그를 대기열에 저장합니다 - MDN: %s", mdn)
 
             # 전송 실패 시 큐에 저장
-            with self.queue_lock:
-                if mdn not in self.pending_logs:
-                    self.pending_logs[mdn] = queue.Queue()
-
-                log_entry = {
-                    "data": log_data,
-                    "timestamp": datetime.now(),
-                    "retry_count": 0,
-                    "log_type": self.log_type
-                }
-
-                self.pending_logs[mdn].put(log_entry)
-                print(f"[DEBUG] {self.log_type} 로그 저장 성공 - MDN: {mdn}")
-                print(f"[INFO] 현재 백엔드 전송 대기 로그 개수: {self.count_pending_logs(mdn)} - MDN: {mdn}")
-                return True  # 저장은 성공했으므로 True 반환
+            pending_count = self._enqueue_log(mdn, log_data)
+            logger.debug("%s 로그 저장 성공 - MDN: %s", self.log_type, mdn)
+            logger.info("현재 백엔드 전송 대기 로그 개수: %s - MDN: %s", pending_count, mdn)
+            return True  # 저장은 성공했으므로 True 반환
+
+    def _enqueue_log(self, mdn: str, log_data: Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest]) -> int:
+        """
+        로그를 미전송 대기열에 추가
+
+        Args:
+            mdn: 차량 번호(MDN)
+            log_data: 저장할 로그 데이터
+
+        Returns:
+            int: 추가 후 해당 MDN의 대기 로그 개수
+        """
+        log_entry = {
+            "data": log_data,
+            "timestamp": datetime.now(),
+            "retry_count": 0,
+            "log_type": self.log_type
+        }
+
+        with self.queue_lock:
+            pending = self.pending_logs.get(mdn)
+            if pending is None:
+                pending = self.pending_logs[mdn] = deque()
+            pending.append(log_entry)
+            return len(pending)
 
     def send_log_to_backend(self, log_data: Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest]) -> Tuple[bool, str]:
         """
@@ -127,108 +227,50 @@ class BaseLogHandler(abc.ABC):
             Tuple[bool, str]: (성공 여부, 오류 메시지)
         """
         import requests
-        import json
 
         try:
-            # 요청 URL 구성
-            url = f"{self.backend_url}{self.backend_endpoint}"
-            print(f"[백엔드 통신] 요청 URL: {url}")
-
-            # JSON 변환
-            log_json = log_data.dict()
-            print(f"[백엔드 통신] 요청 로그 타입: {self.log_type}")
-            print(f"[백엔드 통신] 요청 본문 길이: {len(str(log_json))} 바이트")
-
-            # 로그 타입 결정 (시동 ON 또는 시동 OFF)
-            log_type_str = ""
-            if self.log_type == 'power':
-                if log_json.get('onTime') and not log_json.get('offTime'):
-                    log_type_str = "시동 ON"
-                elif log_json.get('offTime'):
-                    log_type_str = "시동 OFF"
-                else:
-                    log_type_str = "알 수 없음"
-                print(f"[백엔드 통신] 전송 중인 로그 유형: {log_type_str}")
-
-            # 디버그용으로 일부 필드 값만 출력
-            debug_fields = {}
-            if self.log_type == 'gps' and 'cList' in log_json and log_json['cList']:
-                debug_fields = {
-                    'mdn': log_json.get('mdn'),
-                    'oTime': log_json.get('oTime'),
-                    'cCnt': log_json.get('cCnt'),
-                    'cList_count': len(log_json['cList']),
-                    'first_point': log_json['cList'][0].dict() if hasattr(log_json['cList'][0], 'dict') else log_json['cList'][0] if log_json['cList'] else None
-                }
-            elif self.log_type == 'power':
-                debug_fields = {
-                    'mdn': log_json.get('mdn'),
-                    'onTime': log_json.get('onTime'),
-                    'offTime': log_json.get('offTime'),
-                    'lat': log_json.get('lat'),
-                    'lon': log_json.get('lon'),
-                    'gcd': log_json.get('gcd'),
-                    'sum': log_json.get('sum')
-                }
-            elif self.log_type == 'geofence':
-                debug_fields = {
-                    'mdn': log_json.get('mdn'),
-                    'oTime': log_json.get('oTime'),
-                    'geoGrpId': log_json.get('geoGrpId'),
-                    'geoPId': log_json.get('geoPId'),
-                    'evtVal': log_json.get('evtVal'),
-                    'lat': log_json.get('lat'),
-                    'lon': log_json.get('lon'),
-                    'gcd': log_json.get('gcd'),
-                    'sum': log_json.get('sum')
-                }
-            print(f"[백엔드 통신] 요청 주요 필드: {debug_fields}")
-
-            # 전체 JSON 데이터 출력 (디버깅용)
-            if self.log_type == 'power':
-                print(f"[백엔드 통신] {log_type_str} 전체 JSON 데이터: {json.dumps(log_json, indent=2)}")
-
-            # 디버그용 로그 출력 (로그 타입에 따라 다른 정보 출력)
-            self._print_debug_log(log_data)
-
-            # 요청 헤더
-            headers = {
-                'Content-Type': 'application/json',
-                'Accept': 'application/json',
-                'User-Agent': 'ThiswayVehicleEmulator/1.0'
-            }
+            # 요청 URL
+            url = self.endpoint_url
+            logger.debug("[백엔드 통신] 요청 URL: %s", url)
+
+            # JSON 변환 (pydantic-core 직렬화기로 본문을 한 번만 인코딩)
+            body = log_data.model_dump_json()
+
+            # 디버그 정보는 DEBUG 레벨이 활성화된 경우에만 구성
+            if logger.isEnabledFor(logging.DEBUG):
+                self._log_request_debug(log_data, body)
 
             # 인증 정보 제거 - 인증 없이 요청
             auth = None
 
             # 요청 전송 시도 기록
-            print(f"[백엔드 통신] {self.log_type} 로그 전송 시도...")
-            print(f"[백엔드 통신] 인증 정보 사용하지 않음 (open access)")
+            logger.debug("[백엔드 통신] %s 로그 전송 시도...", self.log_type)
+            logger.debug("[백엔드 통신] 인증 정보 사용하지 않음 (open access)")
 
             # POST 요청 전송
-            response = requests.post(
+            response = self.session.post(
                 url, 
-                data=json.dumps(log_json), 
-                headers=headers,
+                data=body,
+                headers=self.REQUEST_HEADERS,
                 auth=auth,
                 timeout=10  # 타임아웃 10초
             )
 
             # 응답 처리
-            print(f"[백엔드 통신] 응답 상태코드: {response.status_code}")
-            print(f"[백엔드 통신] 응답 헤더: {dict(response.headers)}")
+            logger.debug("[백엔드 통신] 응답 상태코드: %s", response.status_code)
+            logger.debug("[백엔드 통신] 응답 헤더: %s", response.headers)
 
             if response.status_code in [200, 201]:
                 try:
                     response_data = response.json()
-                    print(f"[백엔드 통신] 응답 본문: {response_data}")
+                    logger.debug("[백엔드 통신] 응답 본문: %s", response_data)
 
                     if response_data.get("code") == "000" or response_data.get("rstCd") == "000":
-                        print(f"[백엔드 통신] 요청 성공: {self.log_type} 로그")
+                        logger.debug("[백엔드 통신] 요청 성공: %s 로그", self.log_type)
 
                         # 시동 OFF 로그 전송 성공 시 추가 확인 로그
                         if self.log_type == 'power' and isinstance(log_data, PowerLogRequest) and log_data.offTime:
-                            print(f"[중요] 시동 OFF 로그 전송 성공 확인 - MDN: {log_data.mdn}, offTime: {log_data.offTime}, 좌표: ({log_data.lat}, {log_data.lon})")
+                            logger.info("[중요] 시동 OFF 로그 전송 성공 확인 - MDN: %s, offTime: %s, 좌표: (%s, %s)", log_data.mdn, log_data.offTime, log_data.lat, log_data.lon)
 
                         return True, "Success"
                     else:
@@ -236,62 +278,180 @@ class BaseLogHandler(abc.ABC):
                         error_message = response_data.get('message') or response_data.get('rstMsg', '알 수 없는 오류')
                         error_code = response_data.get('code') or response_data.get('rstCd', 'N/A')
                         error_msg = f"백엔드 오류: {error_message} (Code: {error_code})"
-                        print(f"[오류] {error_msg}")
+                        logger.error("%s", error_msg)
                         return False, error_msg
                 except ValueError as e:
                     error_msg = f"JSON 응답 파싱 오류: {str(e)}, 응답 본문: {response.text[:200]}"
-                    print(f"[오류] {error_msg}")
+                    logger.error("%s", error_msg)
                     return False, error_msg
             else:
                 error_msg = f"백엔드 응답 오류: HTTP {response.status_code} - {response.text[:200]}"
-                print(f"[오류] {error_msg}")
+                logger.error("%s", error_msg)
                 # 401 오류 처리 제거 - 인증을 사용하지 않으므로 필요없음
                 return False, error_msg
 
         except requests.exceptions.ConnectionError as e:
             error_msg = f"서버 연결 오류: {str(e)}"
-            print(f"[연결 오류] 백엔드 서버({self.backend_url})에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.")
-            print(f"[연결 오류] 상세 오류 정보: {str(e)}")
+            logger.error("[연결 오류] 백엔드 서버(%s)에 연결할 수 없습니다. 서버가 실행 중인지 확인하세요.", self.backend_url)
+            logger.error("[연결 오류] 상세 오류 정보: %s", str(e))
 
             # 로그 타입 확인 (시동 OFF 로그인 경우 더 자세한 정보 출력)
             if self.log_type == 'power' and isinstance(log_data, PowerLogRequest) and log_data.offTime:
-                print(f"[중요] 시동 OFF 로그 전송 실패 - MDN: {log_data.mdn}, onTime: {log_data.onTime}, offTime: {log_data.offTime}")
-                print(f"[중요] 백엔드 서버 URL: {self.backend_url}{self.backend_endpoint}")
-                print(f"[중요] 백엔드 서버가 실행 중인지 확인하세요. 현재 설정된 URL: {self.backend_url}")
+                logger.warning("[중요] 시동 OFF 로그 전송 실패 - MDN: %s, onTime: %s, offTime: %s", log_data.mdn, log_data.onTime, log_data.offTime)
+                logger.warning("[중요] 백엔드 서버 URL: %s", self.endpoint_url)
+                logger.warning("[중요] 백엔드 서버가 실행 중인지 확인하세요. 현재 설정된 URL: %s", self.backend_url)
 
             return False, error_msg
         except requests.exceptions.Timeout as e:
             error_msg = f"요청 시간 초과: {str(e)}"
-            print(f"[시간 초과] 백엔드 서버가 응답하지 않습니다 (10초 타임아웃)")
-            print(f"[시간 초과] 상세 오류 정보: {str(e)}")
+            logger.error("[시간 초과] 백엔드 서버가 응답하지 않습니다 (10초 타임아웃)")
+            logger.error("[시간 초과] 상세 오류 정보: %s", str(e))
 
             # 로그 타입 확인 (시동 OFF 로그인 경우 더 자세한 정보 출력)
             if self.log_type == 'power' and isinstance(log_data, PowerLogRequest) and log_data.offTime:
-                print(f"[중요] 시동 OFF 로그 전송 시간 초과 - MDN: {log_data.mdn}, onTime: {log_data.onTime}, offTime: {log_data.offTime}")
+                logger.warning("[중요] 시동 OFF 로그 전송 시간 초과 - MDN: %s, onTime: %s, offTime: %s", log_data.mdn, log_data.onTime, log_data.offTime)
 
             return False, error_msg
         except requests.exceptions.RequestException as e:
             error_msg = f"요청 오류: {str(e)}"
-            print(f"[오류] {error_msg}")
-            print(f"[오류] 상세 오류 정보: {str(e)}")
+            logger.error("%s", error_msg)
+            logger.error("상세 오류 정보: %s", str(e))
 
             # 로그 타입 확인 (시동 OFF 로그인 경우 더 자세한 정보 출력)
             if self.log_type == 'power' and isinstance(log_data, PowerLogRequest) and log_data.offTime:
-                print(f"[중요] 시동 OFF 로그 전송 요청 오류 - MDN: {log_data.mdn}, onTime: {log_data.onTime}, offTime: {log_data.offTime}")
+                logger.warning("[중요] 시동 OFF 로그 전송 요청 오류 - MDN: %s, onTime: %s, offTime: %s", log_data.mdn, log_data.onTime, log_data.offTime)
 
             return False, error_msg
         except Exception as e:
             error_msg = f"예상치 못한 오류: {str(e)}"
-            print(f"[오류] {error_msg}")
+            logger.error("%s", error_msg)
             import traceback
-            print(f"[오류] 상세 스택 트레이스: {traceback.format_exc()}")
+            logger.error("상세 스택 트레이스: %s", traceback.format_exc())
 
             # 로그 타입 확인 (시동 OFF 로그인 경우 더 자세한 정보 출력)
             if self.log_type == 'power' and isinstance(log_data, PowerLogRequest) and log_data.offTime:
-                print(f"[중요] 시동 OFF 로그 전송 중 예상치 못한 오류 - MDN: {log_data.mdn}, onTime: {log_data.onTime}, offTime: {log_data.offTime}")
+                logger.warning("[중요] 시동 OFF 로그 전송 중 예상치 못한 오류 - MDN: %s, onTime: %s, offTime: %s", log_data.mdn, log_data.onTime, log_data.offTime)
+
+            return False, error_msg
+
+    def _log_request_debug(self, log_data: Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest], body: str) -> None:
+        """
+        전송 요청의 주요 필드를 DEBUG 레벨로 기록
+
+        Args:
+            log_data: 전송할 로그 데이터
+            body: 인코딩된 요청 본문
+        """
+        log_json = log_data.model_dump(exclude={'cList'})
+        logger.debug("[백엔드 통신] 요청 로그 타입: %s", self.log_type)
+        logger.debug("[백엔드 통신] 요청 본문 길이: %s 바이트", len(body))
+
+        # 로그 타입 결정 (시동 ON 또는 시동 OFF)
+        log_type_str = ""
+        if self.log_type == 'power':
+            if log_json.get('onTime') and not log_json.get('offTime'):
+                log_type_str = "시동 ON"
+            elif log_json.get('offTime'):
+                log_type_str = "시동 OFF"
+            else:
+                log_type_str = "알 수 없음"
+            logger.debug("[백엔드 통신] 전송 중인 로그 유형: %s", log_type_str)
+
+        # 디버그용으로 일부 필드 값만 출력
+        debug_fields = {}
+        if self.log_type == 'gps' and getattr(log_data, 'cList', None):
+            debug_fields = {
+                'mdn': log_json.get('mdn'),
+                'oTime': log_json.get('oTime'),
+                'cCnt': log_json.get('cCnt'),
+                'cList_count': len(log_data.cList),
+                'first_point': log_data.cList[0].model_dump()
+            }
+        elif self.log_type == 'power':
+            debug_fields = {
+                'mdn': log_json.get('mdn'),
+                'onTime': log_json.get('onTime'),
+                'offTime': log_json.get('offTime'),
+                'lat': log_json.get('lat'),
+                'lon': log_json.get('lon'),
+                'gcd': log_json.get('gcd'),
+                'sum': log_json.get('sum')
+            }
+        elif self.log_type == 'geofence':
+            debug_fields = {
+                'mdn': log_json.get('mdn'),
+                'oTime': log_json.get('oTime'),
+                'geoGrpId': log_json.get('geoGrpId'),
+                'geoPId': log_json.get('geoPId'),
+                'evtVal': log_json.get('evtVal'),
+                'lat': log_json.get('lat'),
+                'lon': log_json.get('lon'),
+                'gcd': log_json.get('gcd'),
+                'sum': log_json.get('sum')
+            }
+        logger.debug("[백엔드 통신] 요청 주요 필드: %s", debug_fields)
+
+        # 전체 JSON 데이터 출력 (디버깅용)
+        if self.log_type == 'power':
+            logger.debug("[백엔드 통신] %s 전체 JSON 데이터: %s", log_type_str, json.dumps(log_json, indent=2))
+
+        # 디버그용 로그 출력 (로그 타입에 따라 다른 정보 출력)
+        self._print_debug_log(log_data)
+
+    def send_logs_to_backend(self, logs: List[Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest]]) -> Tuple[bool, str]:
+        """
+        여러 로그를 하나의 JSON 배열로 묶어 일괄 전송 엔드포인트에 전송
+
+        Args:
+            logs: 전송할 로그 데이터 목록
+
+        Returns:
+            Tuple[bool, str]: (성공 여부, 오류 메시지)
+        """
+        import requests
 
+        url = self.batch_endpoint_url
+        body = "[" + ",".join(log_data.model_dump_json() for log_data in logs) + "]"
+        logger.debug("[백엔드 통신] %s 로그 %s개 일괄 전송 시도 - URL: %s, 본문 길이: %s 바이트", self.log_type, len(logs), url, len(body))
+
+        try:
+            response = self.session.post(url, data=body, headers=self.REQUEST_HEADERS, timeout=10)
+        except requests.exceptions.RequestException as e:
+            error_msg = f"일괄 전송 요청 오류: {str(e)}"
+            logger.error("%s", error_msg)
             return False, error_msg
 
+        logger.debug("[백엔드 통신] 일괄 전송 응답 상태코드: %s", response.status_code)
+
+        if response.status_code in (404, 405):
+            # 일괄 전송 엔드포인트가 없는 백엔드 - 이후에는 개별 전송 사용
+            self.batch_supported = False
+            error_msg = f"일괄 전송 엔드포인트 미지원: HTTP {response.status_code}"
+            logger.warning("%s - 개별 전송으로 전환합니다", error_msg)
+            return False, error_msg
+
+        if response.status_code not in [200, 201]:
+            error_msg = f"백엔드 응답 오류: HTTP {response.status_code} - {response.text[:200]}"
+            logger.error("%s", error_msg)
+            return False, error_msg
+
+        try:
+            response_data = response.json()
+        except ValueError as e:
+            error_msg = f"JSON 응답 파싱 오류: {str(e)}, 응답 본문: {response.text[:200]}"
+            logger.error("%s", error_msg)
+            return False, error_msg
+
+        if response_data.get("code") == "000" or response_data.get("rstCd") == "000":
+            logger.debug("[백엔드 통신] 일괄 전송 성공: %s 로그 %s개", self.log_type, len(logs))
+            return True, "Success"
+
+        error_message = response_data.get('message') or response_data.get('rstMsg', '알 수 없는 오류')
+        error_code = response_data.get('code') or response_data.get('rstCd', 'N/A')
+        error_msg = f"백엔드 오류: {error_message} (Code: {error_code})"
+        logger.error("%s", error_msg)
+        return False, error_msg
+
     def process_all_pending_logs(self) -> int:
         """
         모든 MDN에 대한 미전송 로그 처리
@@ -303,6 +463,7 @@ class BaseLogHandler(abc.ABC):
 
         # 현재 큐에 있는 모든 MDN 목록 복사
         with self.queue_lock:
+            self.last_failed_count = 0
             mdn_list = list(self.pending_logs.keys())
 
         # 각 MDN에 대한 로그 처리
@@ -312,34 +473,28 @@ class BaseLogHandler(abc.ABC):
 
         return total_processed
 
-    def get_pending_logs(self, mdn: str) -> list:
+    def get_pending_logs(self, mdn: str, limit: Optional[int] = None) -> list:
         """
-        특정 MDN에 대한 미전송 로그 목록 조회
+        특정 MDN에 대한 미전송 로그 목록 조회 (대기열은 비우지 않음)
 
         Args:
             mdn: 차량 번호(MDN)
+            limit: 반환할 최대 로그 수 (None이면 전체)
 
         Returns:
             list: 미전송 로그 목록
         """
-        logs = []
         with self.queue_lock:
-            if mdn in self.pending_logs:
-                # 큐의 내용을 리스트로 변환 (큐를 비우지 않고 복사)
-                temp_queue = queue.Queue()
-                while not self.pending_logs[mdn].empty():
-                    log_entry = self.pending_logs[mdn].get()
-                    logs.append(log_entry)
-                    temp_queue.put(log_entry)
-
-                # 원래 큐 복원
-                self.pending_logs[mdn] = temp_queue
-
-        return logs
+            if mdn not in self.pending_logs:
+                return []
+            # 큐를 꺼냈다 다시 넣지 않고 필요한 만큼만 복사
+            return list(itertools.islice(self.pending_logs[mdn], limit))
 
     def process_pending_logs(self, mdn: str) -> int:
         """
         특정 MDN에 대한 미전송 로그 처리
+        대기열을 비운 뒤 락을 해제한 상태에서 전송하므로 전송 중에도 새 로그를 적재할 수 있으며,
+        전송에 실패한 로그는 대기열 앞쪽에 다시 넣습니다.
 
         Args:
             mdn: 차량 번호(MDN)
@@ -347,50 +502,69 @@ class BaseLogHandler(abc.ABC):
         Returns:
             int: 처리된 로그 수
         """
-        processed_count = 0
-
         with self.queue_lock:
-            if mdn not in self.pending_logs or self.pending_logs[mdn].empty():
+            # 대기열을 통째로 떼어내고, 처리 중 새로 적재되는 로그는 새 deque에 쌓이도록 함
+            entries = self.pending_logs.pop(mdn, None)
+            if not entries:
                 return 0
 
-            # 큐에서 항목을 하나씩 처리
-            temp_queue = queue.Queue()
-            current_time = datetime.now()
+        # 오래된 로그는 삭제
+        current_time = datetime.now()
+        max_age = timedelta(hours=self.max_storage_hours)
+        valid_entries = []
+        for log_entry in entries:
+            if current_time - log_entry["timestamp"] >= max_age:
+                logger.info("%s 로그 최대 보관 시간 초과 - 폐기합니다. MDN: %s", self.log_type, mdn)
+                continue
+            valid_entries.append(log_entry)
+
+        failed_entries = []
+        for start in range(0, len(valid_entries), self.max_batch_size):
+            batch = valid_entries[start:start + self.max_batch_size]
+
+            if len(batch) > 1 and self.batch_endpoint and self.batch_supported:
+                logger.debug("%s 로그 %s개 일괄 처리 시도 - MDN: %s", self.log_type, len(batch), mdn)
+                success, error_msg = self.send_logs_to_backend([log_entry["data"] for log_entry in batch])
+                if success:
+                    logger.info("%s 로그 %s개 일괄 전송 성공 - MDN: %s", self.log_type, len(batch), mdn)
+                    continue
+                if self.batch_supported:
+                    logger.error("%s 로그 일괄 전송 실패 - MDN: %s, 오류: %s", self.log_type, mdn, error_msg)
+                    for log_entry in batch:
+                        log_entry["retry_count"] = log_entry.get("retry_count", 0) + 1
+                    failed_entries.extend(batch)
+                    continue
+                # 일괄 전송 미지원으로 판명되면 아래에서 개별 전송
 
-            while not self.pending_logs[mdn].empty():
-                log_entry = self.pending_logs[mdn].get()
+            for log_entry in batch:
                 retry_count = log_entry.get("retry_count", 0)
-
-                print(f"[DEBUG] {self.log_type} 로그 처리 시도 - MDN: {mdn}, 재시도: {retry_count}")
-
-                # 오래된 로그는 삭제
-                time_diff = current_time - log_entry["timestamp"]
-                if time_diff >= timedelta(hours=self.max_storage_hours):
-                    print(f"[INFO] {self.log_type} 로그 최대 보관 시간 초과 - 폐기합니다. MDN: {mdn}")
-                    continue
+                logger.debug("%s 로그 처리 시도 - MDN: %s, 재시도: %s", self.log_type, mdn, retry_count)
 
                 # 로그 전송 시도
                 success, error_msg = self.send_log_to_backend(log_entry["data"])
-                processed_count += 1
 
                 if success:
-                    print(f"[INFO] {self.log_type} 로그 전송 성공 - MDN: {mdn}")
-                    print(f"[DEBUG] 성공한 로그는 더 이상 보관하지 않습니다 (자동 삭제) - MDN: {mdn}")
+                    logger.info("%s 로그 전송 성공 - MDN: %s", self.log_type, mdn)
+                    logger.debug("성공한 로그는 더 이상 보관하지 않습니다 (자동 삭제) - MDN: %s", mdn)
                 else:
-                    print(f"[ERROR] {self.log_type} 로그 전송 실패 - MDN: {mdn}, 오류: {error_msg}")
+                    logger.error("%s 로그 전송 실패 - MDN: %s, 오류: %s", self.log_type, mdn, error_msg)
                     # 재시도 횟수 증가
                     log_entry["retry_count"] = retry_count + 1
                     # 전송 실패한 로그는 다시 큐에 넣기
-                    print(f"[DEBUG] 실패한 로그 재시도 대기열에 등록 - MDN: {mdn}, 재시도: {log_entry['retry_count']}")
-                    temp_queue.put(log_entry)
+                    logger.debug("실패한 로그 재시도 대기열에 등록 - MDN: %s, 재시도: %s", mdn, log_entry['retry_count'])
+                    failed_entries.append(log_entry)
 
-            # 전송 실패한 로그만 다시 저장
-            if not temp_queue.empty():
-                self.pending_logs[mdn] = temp_queue
-            else:
-                del self.pending_logs[mdn]
-
-        return processed_count
+        # 전송 실패한 로그를 처리 중 새로 적재된 로그보다 앞에 다시 저장
+        with self.queue_lock:
+            if failed_entries:
+                current_queue = self.pending_logs.get(mdn)
+                new_queue = deque(failed_entries)
+                if current_queue:
+                    new_queue.extend(current_queue)
+                self.pending_logs[mdn] = new_queue
+            self.last_failed_count += len(failed_entries)
+
+        return len(valid_entries)
 
     @abc.abstractmethod
     def _print_debug_log(self, log_data: Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest]) -> None:
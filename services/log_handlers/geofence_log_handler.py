@@ -3,23 +3,28 @@
 지오펜스 이벤트 로그를 처리합니다.
 """
 
+import logging
 from typing import Union
 from models.emulator_data import GpsLogRequest, PowerLogRequest, GeofenceLogRequest
 from .base_log_handler import BaseLogHandler
 
+logger = logging.getLogger(__name__)
+
 
 class GeofenceLogHandler(BaseLogHandler):
     """지오펜스 로그 처리 핸들러"""
     
-    def __init__(self, max_storage_hours: int = 1, backend_url: str = "http://localhost:8080"):
+    def __init__(self, max_storage_hours: int = 1, backend_url: str = "http://localhost:8080", session=None):
         """
         지오펜스 로그 핸들러 초기화
         
         Args:
             max_storage_hours: 최대 로그 보관 시간 (시간)
             backend_url: 백엔드 서버 URL
+            session: 전송에 사용할 HTTP 세션 (None이면 핸들러 전용 세션 생성)
         """
-        super().__init__(log_type="geofence", max_storage_hours=max_storage_hours, backend_url=backend_url, use_auth=False)
+        super().__init__(log_type="geofence", max_storage_hours=max_storage_hours, backend_url=backend_url, use_auth=False,
+                         session=session)
     
     # 로그 타입은 초기화 시 설정함
         
@@ -39,15 +44,15 @@ class GeofenceLogHandler(BaseLogHandler):
         Returns:
             bool: 저장 성공 여부
         """
-        print(f"[DEBUG] 지오펜스 로그 저장 시도 - MDN: {mdn}, 지오펜스 ID: {geofence_log.geoPId}, 이벤트: {geofence_log.evtVal}")
+        logger.debug("지오펜스 로그 저장 시도 - MDN: %s, 지오펜스 ID: %s, 이벤트: %s", mdn, geofence_log.geoPId, geofence_log.evtVal)
         success = self.store_log(mdn, geofence_log)
         
         if success:
-            print(f"[DEBUG] 지오펜스 로그 저장 성공 - MDN: {mdn}")
-            print(f"[INFO] 지오펜스 로그 저장 및 전송 큐 등록 완료 - MDN: {mdn}")
-            print(f"[INFO] 현재 백엔드 전송 대기 로그 개수: {self.count_pending_logs(mdn)} - MDN: {mdn}")
+            logger.debug("지오펜스 로그 저장 성공 - MDN: %s", mdn)
+            logger.info("지오펜스 로그 저장 및 전송 큐 등록 완료 - MDN: %s", mdn)
+            logger.info("현재 백엔드 전송 대기 로그 개수: %s - MDN: %s", self.count_pending_logs(mdn), mdn)
         else:
-            print(f"[ERROR] 지오펜스 로그 저장 실패 - MDN: {mdn}")
+            logger.error("지오펜스 로그 저장 실패 - MDN: %s", mdn)
             
         return success
     
@@ -55,6 +60,6 @@ class GeofenceLogHandler(BaseLogHandler):
         """지오펜스 로그에 맞는 디버그 정보 출력"""
         if isinstance(log_data, GeofenceLogRequest):
             geofence_log = log_data
-            print(f"[디버깅] 지오펜스 로그: {geofence_log.mdn}, 그룹 ID: {geofence_log.geoGrpId}, 포인트 ID: {geofence_log.geoPId}, 이벤트: {geofence_log.evtVal}, 좌표: ({geofence_log.lat}, {geofence_log.lon})")
+            logger.debug("지오펜스 로그: %s, 그룹 ID: %s, 포인트 ID: %s, 이벤트: %s, 좌표: (%s, %s)", geofence_log.mdn, geofence_log.geoGrpId, geofence_log.geoPId, geofence_log.evtVal, geofence_log.lat, geofence_log.lon)
         else:
-            print(f"[경고] 잘못된 로그 타입: GeofenceLogHandler에 {type(log_data).__name__} 타입 전달됨")
+            logger.warning("잘못된 로그 타입: GeofenceLogHandler에 %s 타입 전달됨", type(log_data).__name__)
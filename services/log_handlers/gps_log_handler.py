@@ -3,24 +3,29 @@ GPS 로그 핸들러
 GPS 위치 로그를 처리합니다.
 """
 
+import logging
 from typing import Union, List, Dict, Any
 from datetime import datetime
 from models.emulator_data import GpsLogRequest, PowerLogRequest, GeofenceLogRequest
 from .base_log_handler import BaseLogHandler
 
+logger = logging.getLogger(__name__)
+
 
 class GpsLogHandler(BaseLogHandler):
     """GPS 로그 처리 핸들러"""
 
-    def __init__(self, max_storage_hours: int = 1, backend_url: str = "http://localhost:8080"):
+    def __init__(self, max_storage_hours: int = 1, backend_url: str = "http://localhost:8080", session=None):
         """
         GPS 로그 핸들러 초기화
 
         Args:
             max_storage_hours: 최대 로그 보관 시간 (시간) - GPS 로그는 1시간 보관 기본값
             backend_url: 백엔드 서버 URL
+            session: 전송에 사용할 HTTP 세션 (None이면 핸들러 전용 세션 생성)
         """
-        super().__init__(log_type="gps", max_storage_hours=max_storage_hours, backend_url=backend_url, use_auth=False)
+        super().__init__(log_type="gps", max_storage_hours=max_storage_hours, backend_url=backend_url, use_auth=False,
+                         session=session)
 
     # 로그 타입은 초기화 시 설정함
 
@@ -29,6 +34,11 @@ class GpsLogHandler(BaseLogHandler):
         """백엔드 API 엔드포인트"""
         return "/api/logs/gps"
 
+    @property
+    def batch_endpoint(self) -> str:
+        """GPS 로그 일괄 전송 API 엔드포인트"""
+        return "/api/logs/gps/batch"
+
     def store_gps_log(self, mdn: str, gps_log: GpsLogRequest) -> bool:
         """
         GPS 로그 데이터를 저장
@@ -41,15 +51,15 @@ class GpsLogHandler(BaseLogHandler):
             bool: 저장 성공 여부
         """
         log_count = len(gps_log.cList) if hasattr(gps_log, 'cList') else 0
-        print(f"[DEBUG] GPS 로그 저장 시도 - MDN: {mdn}, 항목 수: {log_count}")
+        logger.debug("GPS 로그 저장 시도 - MDN: %s, 항목 수: %s", mdn, log_count)
         success = self.store_log(mdn, gps_log)
 
         if success:
-            print(f"[DEBUG] GPS 로그 저장 성공 - MDN: {mdn}, 항목 수: {log_count}")
-            print(f"[INFO] GPS 로그 저장 및 전송 큐 등록 완료 - MDN: {mdn}")
-            print(f"[INFO] 현재 백엔드 전송 대기 로그 개수: {self.count_pending_logs(mdn)} - MDN: {mdn}")
+            logger.debug("GPS 로그 저장 성공 - MDN: %s, 항목 수: %s", mdn, log_count)
+            logger.info("GPS 로그 저장 및 전송 큐 등록 완료 - MDN: %s", mdn)
+            logger.info("현재 백엔드 전송 대기 로그 개수: %s - MDN: %s", self.count_pending_logs(mdn), mdn)
         else:
-            print(f"[ERROR] GPS 로그 저장 실패 - MDN: {mdn}")
+            logger.error("GPS 로그 저장 실패 - MDN: %s", mdn)
 
         return success
 
@@ -66,7 +76,7 @@ class GpsLogHandler(BaseLogHandler):
             GpsLogRequest: 생성된 GPS 로그 요청 객체
         """
         if not data_points:
-            print(f"[경고] 배치 처리할 GPS 데이터 없음 - MDN: {mdn}")
+            logger.warning("배치 처리할 GPS 데이터 없음 - MDN: %s", mdn)
             return None
 
         # 현재 시간을 yyyymmddhhmm 포맷으로 변환
@@ -117,6 +127,6 @@ class GpsLogHandler(BaseLogHandler):
             gps_log = log_data
             first_point = gps_log.cList[0]
             last_point = gps_log.cList[-1]
-            print(f"[디버깅] GPS 좌표 정보: 처음({first_point.lat}, {first_point.lon}), 마지막({last_point.lat}, {last_point.lon})")
+            logger.debug("GPS 좌표 정보: 처음(%s, %s), 마지막(%s, %s)", first_point.lat, first_point.lon, last_point.lat, last_point.lon)
         else:
-            print(f"[경고] 잘못된 로그 타입 또는 빈 데이터: GpsLogHandler에 {type(log_data).__name__} 타입 전달됨")
+            logger.warning("잘못된 로그 타입 또는 빈 데이터: GpsLogHandler에 %s 타입 전달됨", type(log_data).__name__)
@@ -3,18 +3,22 @@
 각 로그 타입별 핸들러를 관리하고 백그라운드 전송 스레드를 운영합니다.
 """
 
+import logging
 import threading
 import time
 import os
-import json
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Tuple, Union
 
+from config import load_config_file
 from models.emulator_data import GpsLogRequest, PowerLogRequest, GeofenceLogRequest
+from services.log_handlers.base_log_handler import create_http_session
 from services.log_handlers.gps_log_handler import GpsLogHandler
 from services.log_handlers.power_log_handler import PowerLogHandler
 from services.log_handlers.geofence_log_handler import GeofenceLogHandler
 
+logger = logging.getLogger(__name__)
+
 def get_backend_url():
     """
     백엔드 URL 설정 가져오기
@@ -37,24 +41,23 @@ def get_backend_url():
         config_path = os.environ.get("CONFIG_PATH", "config.json")
         # 설정 파일이 있는지 확인
         if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                config = json.load(f)
-                if "backend_url" in config:
-                    backend_url = config["backend_url"]
-                    print(f"[INFO] {config_path}에서 백엔드 URL 설정 로드: {backend_url}")
+            config = load_config_file()
+            if "backend_url" in config:
+                backend_url = config["backend_url"]
+                logger.info("%s에서 백엔드 URL 설정 로드: %s", config_path, backend_url)
     except Exception as e:
-        print(f"[경고] 설정 파일 읽기 실패: {str(e)}")
+        logger.warning("설정 파일 읽기 실패: %s", str(e))
 
     # 2. 환경 변수에서 백엔드 URL 확인 (config.json에서 로드 실패한 경우)
     if not backend_url:
         backend_url = os.environ.get("BACKEND_URL")
         if backend_url:
-            print(f"[INFO] 환경 변수에서 백엔드 URL 설정 로드: {backend_url}")
+            logger.info("환경 변수에서 백엔드 URL 설정 로드: %s", backend_url)
 
     # 3. 기본값 사용 (config.json과 환경 변수 모두 실패한 경우)
     if not backend_url:
         backend_url = default_backend_url
-        print(f"[INFO] 기본 백엔드 URL 사용: {backend_url}")
+        logger.info("기본 백엔드 URL 사용: %s", backend_url)
 
     return backend_url
 
@@ -76,19 +79,18 @@ def get_data_collection_config():
         config_path = os.environ.get("CONFIG_PATH", "config.json")
         # 설정 파일이 있는지 확인
         if os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                config = json.load(f)
-                data_collection = config.get("data_collection", {})
-                interval_sec = data_collection.get("interval_sec", default_interval_sec)
-                batch_size = data_collection.get("batch_size", default_batch_size)
-                send_interval_sec = data_collection.get("send_interval_sec", default_send_interval_sec)
-                print(f"[INFO] {config_path}에서 데이터 수집 설정 로드: interval_sec={interval_sec}, batch_size={batch_size}, send_interval_sec={send_interval_sec}")
-                return interval_sec, batch_size, send_interval_sec
+            config = load_config_file()
+            data_collection = config.get("data_collection", {})
+            interval_sec = data_collection.get("interval_sec", default_interval_sec)
+            batch_size = data_collection.get("batch_size", default_batch_size)
+            send_interval_sec = data_collection.get("send_interval_sec", default_send_interval_sec)
+            logger.info("%s에서 데이터 수집 설정 로드: interval_sec=%s, batch_size=%s, send_interval_sec=%s", config_path, interval_sec, batch_size, send_interval_sec)
+            return interval_sec, batch_size, send_interval_sec
     except Exception as e:
-        print(f"[경고] 설정 파일 읽기 실패: {str(e)}")
+        logger.warning("설정 파일 읽기 실패: %s", str(e))
 
     # 기본값 사용
-    print(f"[INFO] 기본 데이터 수집 설정 사용: interval_sec={default_interval_sec}, batch_size={default_batch_size}, send_interval_sec={default_send_interval_sec}")
+    logger.info("기본 데이터 수집 설정 사용: interval_sec=%s, batch_size=%s, send_interval_sec=%s", default_interval_sec, default_batch_size, default_send_interval_sec)
     return default_interval_sec, default_batch_size, default_send_interval_sec
 
 
@@ -98,48 +100,62 @@ class LogStorageManager:
     각 로그 타입별 핸들러를 생성하고 백그라운드 전송 스레드를 관리합니다.
     """
 
-    def __init__(self, send_interval_seconds: int = 300):
+    def __init__(self, send_interval_seconds: int = 300, flush_interval_seconds: float = 1.0):
         """
         로그 저장 관리자 초기화
 
         Args:
-            send_interval_seconds: 백그라운드 전송 간격(초), 기본값은 300초(5분)
-                                  로그는 즉시 전송되므로 백그라운드 전송은 실패한 로그 재시도용
+            send_interval_seconds: 전송 실패 후 재시도까지 대기하는 간격(초), 기본값은 300초(5분)
+                                   첫 전송 지연에는 영향을 주지 않음
+            flush_interval_seconds: 백그라운드 전송 스레드가 대기열을 비우는 최대 간격(초)
+                                    값이 클수록 한 번에 묶어 보내는 로그가 많아지고 지연은 늘어남
         """
         # 백엔드 API 서버 URL (config.json 또는 환경 변수에서 가져옴)
         self.backend_url = get_backend_url()
-        print(f"[설정] 백엔드 URL: {self.backend_url}")
-        print(f"[설정] GPS 로그 엔드포인트: {self.backend_url}/api/logs/gps")
-        print(f"[설정] 시동 로그 엔드포인트: {self.backend_url}/api/logs/power")
-        print(f"[설정] 지오펜스 로그 엔드포인트: {self.backend_url}/api/logs/geofence")
+        logger.info("[설정] 백엔드 URL: %s", self.backend_url)
+        logger.info("[설정] GPS 로그 엔드포인트: %s/api/logs/gps", self.backend_url)
+        logger.info("[설정] 시동 로그 엔드포인트: %s/api/logs/power", self.backend_url)
+        logger.info("[설정] 지오펜스 로그 엔드포인트: %s/api/logs/geofence", self.backend_url)
+
+        # 모든 로그 핸들러가 공유하는 HTTP 세션 (연결 풀 + keep-alive)
+        self.session = create_http_session()
 
         # 백엔드 연결 상태 확인
         try:
-            import requests
-            print(f"[설정] 백엔드 서버 연결 상태 확인 중...")
-            response = requests.get(f"{self.backend_url}/api/auth/health", timeout=3)
+            logger.info("[설정] 백엔드 서버 연결 상태 확인 중...")
+            response = self.session.get(f"{self.backend_url}/api/auth/health", timeout=3)
             if response.status_code == 200:
-                print(f"[설정] 백엔드 서버 연결 성공! 상태: {response.status_code}")
+                logger.info("[설정] 백엔드 서버 연결 성공! 상태: %s", response.status_code)
                 self.backend_connection_status = "Connected"
             elif response.status_code == 401:
-                print(f"[설정] 백엔드 서버 연결됨: 인증 필요 (401) - 인증 없이 진행합니다")
+                logger.info("[설정] 백엔드 서버 연결됨: 인증 필요 (401) - 인증 없이 진행합니다")
                 self.backend_connection_status = "Connected (Auth Required)"
                 # 인증 오류는 정상 연결로 간주 (인증 없이 로그 전송 시도 예정)
             else:
-                print(f"[설정] 백엔드 서버 연결됨. 비정상 응답: {response.status_code}")
+                logger.info("[설정] 백엔드 서버 연결됨. 비정상 응답: %s", response.status_code)
                 self.backend_connection_status = f"Connected (Abnormal: {response.status_code})"
         except Exception as e:
-            print(f"[설정] 백엔드 서버 연결 실패: {str(e)}")
-            print(f"[설정] 유효한 URL인지 확인하세요: {self.backend_url}")
+            logger.info("[설정] 백엔드 서버 연결 실패: %s", str(e))
+            logger.info("[설정] 유효한 URL인지 확인하세요: %s", self.backend_url)
             self.backend_connection_status = f"Connection Failed: {str(e)}"
 
         # 로그 핸들러 초기화 - 즉시 전송 모드 활성화
-        self.gps_handler = GpsLogHandler(max_storage_hours=1, backend_url=self.backend_url)
-        self.power_handler = PowerLogHandler(max_storage_hours=24, backend_url=self.backend_url)
-        self.geofence_handler = GeofenceLogHandler(max_storage_hours=1, backend_url=self.backend_url)
+        self.gps_handler = GpsLogHandler(max_storage_hours=1, backend_url=self.backend_url, session=self.session)
+        self.power_handler = PowerLogHandler(max_storage_hours=24, backend_url=self.backend_url, session=self.session)
+        self.geofence_handler = GeofenceLogHandler(max_storage_hours=1, backend_url=self.backend_url, session=self.session)
+
+        # 로그 타입 문자열 -> (로그 모델 클래스, 저장 함수) 디스패치 테이블
+        self.store_dispatch = {
+            "gps": (GpsLogRequest, self.gps_handler.store_gps_log),
+            "power": (PowerLogRequest, self.power_handler.store_power_log),
+            "geofence": (GeofenceLogRequest, self.geofence_handler.store_geofence_log)
+        }
 
         # 로그 전송 간격 (초 단위) - 실패한 로그 재시도용
+        # 첫 전송은 대기 없이 바로 시도하며, 이 값은 전송에 실패한 로그의 재시도 간격에만 적용됨
         self.send_interval_seconds = send_interval_seconds
+        # 대기열 일괄 전송 간격 (초 단위)
+        self.flush_interval_seconds = flush_interval_seconds
 
         # 백엔드 연결 상태 로깅
         self.last_connection_attempt = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -147,11 +163,17 @@ class LogStorageManager:
         # 백그라운드 스레드 상태
         self.running = False
         self.sender_thread = None
-
-        print(f"로그 저장 관리자 초기화 완료 - 즉시 전송 모드 활성화")
-        print(f"백엔드 서버 상태: {self.backend_connection_status}")
-        print(f"실패한 로그 재시도 간격: {self.send_interval_seconds}초")
-        print(f"로그 보관 시간 - GPS: {self.gps_handler.max_storage_hours}시간, 시동: {self.power_handler.max_storage_hours}시간")
+        # 새 로그 적재를 전송 스레드에 알리기 위한 조건 변수
+        self.send_condition = threading.Condition()
+        self.has_new_logs = False
+        # 즉시 전송 요청/완료 번호 (전송 스레드 실행 중 flush_pending 호출 시 스레드에 전송을 맡기고 완료를 기다림)
+        self.flush_requested = 0
+        self.flush_completed = 0
+
+        logger.info("로그 저장 관리자 초기화 완료 - 백그라운드 전송 스레드 시작 전까지 즉시 전송 모드")
+        logger.info("백엔드 서버 상태: %s", self.backend_connection_status)
+        logger.info("실패한 로그 재시도 간격: %s초", self.send_interval_seconds)
+        logger.info("로그 보관 시간 - GPS: %s시간, 시동: %s시간", self.gps_handler.max_storage_hours, self.power_handler.max_storage_hours)
 
     #
     # 로그 저장 메서드
@@ -212,14 +234,11 @@ class LogStorageManager:
         Returns:
             bool: 저장 성공 여부
         """
-        if log_type == "gps" and isinstance(log_data, GpsLogRequest):
-            return self.store_gps_log(mdn, log_data)
-        elif log_type == "power" and isinstance(log_data, PowerLogRequest):
-            return self.store_power_log(mdn, log_data)
-        elif log_type == "geofence" and isinstance(log_data, GeofenceLogRequest):
-            return self.store_geofence_log(mdn, log_data)
+        log_class, store_fn = self.store_dispatch.get(log_type, (None, None))
+        if log_class is not None and isinstance(log_data, log_class):
+            return store_fn(mdn, log_data)
         else:
-            print(f"[ERROR] 알 수 없는 로그 타입 또는 로그 데이터 불일치 - MDN: {mdn}, 타입: {log_type}, 데이터: {type(log_data).__name__}")
+            logger.error("알 수 없는 로그 타입 또는 로그 데이터 불일치 - MDN: %s, 타입: %s, 데이터: %s", mdn, log_type, type(log_data).__name__)
             return False
 
     def store_custom_log(self, mdn: str, log_data: Union[GpsLogRequest, PowerLogRequest, GeofenceLogRequest], log_type: str) -> bool:
@@ -240,8 +259,13 @@ class LogStorageManager:
     # 백엔드 전송 관련 메서드
     #
 
-    def process_pending_logs(self) -> None:
-        """모든 로그 핸들러의 미전송 로그 처리"""
+    def process_pending_logs(self) -> int:
+        """
+        모든 로그 핸들러의 미전송 로그 처리
+
+        Returns:
+            int: 전송에 실패하여 대기열에 남은 로그 수
+        """
         try:
             # 각 핸들러의 미전송 로그 처리 (모든 MDN에 대해)
             gps_count = self.gps_handler.process_all_pending_logs()
@@ -249,11 +273,42 @@ class LogStorageManager:
             geofence_count = self.geofence_handler.process_all_pending_logs()
 
             if gps_count > 0 or power_count > 0 or geofence_count > 0:
-                print(f"[INFO] 로그 처리 완료 - GPS: {gps_count}, 전원: {power_count}, 지오펜스: {geofence_count}개")
+                logger.info("로그 처리 완료 - GPS: %s, 전원: %s, 지오펜스: %s개", gps_count, power_count, geofence_count)
+
+            return (self.gps_handler.last_failed_count + self.power_handler.last_failed_count
+                    + self.geofence_handler.last_failed_count)
         except Exception as e:
-            print(f"[ERROR] 미전송 로그 처리 중 오류: {str(e)}")
-            import traceback
-            print(traceback.format_exc())
+            logger.error("미전송 로그 처리 중 오류: %s", str(e), exc_info=True)
+            return 0
+
+    def flush_pending(self, timeout: float = 30.0) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """
+        대기 중인 모든 로그를 한 번에 전송하고 전송 전/후 로그 개수 반환
+        로그 타입별로 일괄 전송 엔드포인트를 사용하므로 대기 로그 수와 관계없이 타입당 한 번의 요청으로 전송됩니다.
+        백그라운드 전송 스레드가 실행 중이면 같은 대기열을 동시에 비우지 않도록 스레드에 전송을 요청하고 완료를 기다립니다.
+
+        Args:
+            timeout: 전송 스레드의 완료를 기다리는 최대 시간(초)
+
+        Returns:
+            Tuple[Dict[str, int], Dict[str, int]]: (전송 전 타입별 개수, 전송 후 타입별 개수)
+        """
+        before = self.count_pending_logs()
+        if not any(before.values()):
+            return before, before
+
+        if self.is_background_sender_running():
+            with self.send_condition:
+                self.flush_requested += 1
+                target = self.flush_requested
+                self.has_new_logs = True
+                self.send_condition.notify_all()
+                if not self.send_condition.wait_for(
+                        lambda: self.flush_completed >= target or not self.running, timeout=timeout):
+                    logger.warning("백그라운드 전송 스레드의 즉시 전송이 %s초 안에 끝나지 않았습니다.", timeout)
+        else:
+            self.process_pending_logs()
+        return before, self.count_pending_logs()
 
     def count_pending_logs(self) -> Dict[str, int]:
         """
@@ -263,19 +318,14 @@ class LogStorageManager:
             Dict[str, int]: 로그 타입별 미전송 로그 개수
         """
         try:
-            # count_pending_logs 메서드로 변경 (count_all_pending_logs는 구현되지 않음)
             # 각 핸들러의 모든 MDN에 대한 로그 수 합산
-            gps_count = sum([len(queue) for queue in self.gps_handler.pending_logs.values()])
-            power_count = sum([len(queue) for queue in self.power_handler.pending_logs.values()])
-            geofence_count = sum([len(queue) for queue in self.geofence_handler.pending_logs.values()])
-
             return {
-                "gps": gps_count,
-                "power": power_count,
-                "geofence": geofence_count
+                "gps": self.gps_handler.count_all_pending_logs(),
+                "power": self.power_handler.count_all_pending_logs(),
+                "geofence": self.geofence_handler.count_all_pending_logs()
             }
         except Exception as e:
-            print(f"[ERROR] 미전송 로그 개수 조회 중 오류: {str(e)}")
+            logger.error("미전송 로그 개수 조회 중 오류: %s", str(e))
             return {"gps": 0, "power": 0, "geofence": 0}
 
     def get_pending_logs_summary(self) -> Dict[str, Any]:
@@ -285,7 +335,6 @@ class LogStorageManager:
         Returns:
             Dict[str, Any]: 로그 타입별 미전송 로그 요약 정보
         """
-        # count_pending_logs 메서드로 변경 (count_all_pending_logs는 구현되지 않음)
         counts = self.count_pending_logs()
         return {
             "gps_logs": counts["gps"],
@@ -299,87 +348,125 @@ class LogStorageManager:
     # 백그라운드 스레드 관리 메서드
     #
 
+    def is_background_sender_running(self) -> bool:
+        """
+        백그라운드 전송 스레드 실행 여부
+
+        Returns:
+            bool: 실행 중이면 True
+        """
+        return self.running and self.sender_thread is not None and self.sender_thread.is_alive()
+
+    def notify_sender(self) -> None:
+        """새 로그가 적재되었음을 백그라운드 전송 스레드에 알림"""
+        with self.send_condition:
+            self.has_new_logs = True
+            self.send_condition.notify_all()
+
     def start_background_sender(self) -> bool:
         """
         백그라운드 전송 스레드 시작
+        시작 후에는 저장되는 로그를 즉시 전송하지 않고 대기열에 모아 전송 스레드가 일괄 전송합니다.
 
         Returns:
             bool: 스레드 시작 성공 여부
         """
         if self.sender_thread and self.sender_thread.is_alive():
-            print("[INFO] 백그라운드 로그 전송 스레드가 이미 실행 중입니다.")
+            logger.info("백그라운드 로그 전송 스레드가 이미 실행 중입니다.")
             return False
 
         self.running = True
         self.sender_thread = threading.Thread(target=self._background_sender_task, daemon=True)
         self.sender_thread.start()
-        print("[INFO] 백그라운드 로그 전송 스레드를 시작했습니다.")
+        for handler in (self.gps_handler, self.power_handler, self.geofence_handler):
+            handler.notify_callback = self.notify_sender
+        logger.info("백그라운드 로그 전송 스레드를 시작했습니다.")
         return True
 
     def stop_background_sender(self) -> bool:
         """
         백그라운드 전송 스레드 중지
+        중지 후 대기열에 남은 로그를 한 번 더 전송 시도합니다.
 
         Returns:
             bool: 스레드 중지 성공 여부
         """
         if not self.sender_thread or not self.sender_thread.is_alive():
-            print("[INFO] 백그라운드 로그 전송 스레드가 실행 중이 아닙니다.")
+            logger.info("백그라운드 로그 전송 스레드가 실행 중이 아닙니다.")
             return False
 
+        for handler in (self.gps_handler, self.power_handler, self.geofence_handler):
+            handler.notify_callback = None
+
         self.running = False
+        self.notify_sender()
         self.sender_thread.join(timeout=5.0)
         if self.sender_thread.is_alive():
-            print("[WARNING] 백그라운드 로그 전송 스레드가 완전히 종료되지 않았습니다.")
+            logger.warning("백그라운드 로그 전송 스레드가 완전히 종료되지 않았습니다.")
             return False
 
-        print("[INFO] 백그라운드 로그 전송 스레드를 중지했습니다.")
+        # 대기열에 남아 있는 로그 마지막 전송 시도
+        self.process_pending_logs()
+
+        # 유휴 연결 정리 (이후 전송이 필요하면 세션이 연결을 다시 맺음)
+        self.session.close()
+
+        logger.info("백그라운드 로그 전송 스레드를 중지했습니다.")
         return True
 
     def _background_sender_task(self) -> None:
-        """백그라운드 로그 전송 작업"""
-        print("[INFO] 백그라운드 로그 전송 스레드가 시작되었습니다.")
-        # 로그 전송 간격 명확하게 표시
-        print(f"[INFO] 실패한 로그 재시도 간격: {self.send_interval_seconds}초")
-        # 디버깅을 위해 현재 설정된 값 출력
-        if self.send_interval_seconds != 300:
-            print(f"[INFO] 기본값(300초)과 다른 재시도 간격이 설정되었습니다: {self.send_interval_seconds}초")
-
-        # 초기 대기 시간
-        print("[INFO] 초기 대기 후 로그 전송을 시작합니다...")
-        time.sleep(5)  # 프로그램 시작 후 5초 후에 첫 전송 시도
+        """
+        백그라운드 로그 전송 작업
+        새 로그 알림을 받거나 flush_interval_seconds가 지나면 대기열을 일괄 전송하고,
+        전송에 실패한 로그가 남으면 send_interval_seconds 동안 재시도를 미룹니다.
+        """
+        logger.info("백그라운드 로그 전송 스레드가 시작되었습니다.")
+        logger.info("대기열 일괄 전송 간격: %s초, 실패한 로그 재시도 간격: %s초", self.flush_interval_seconds, self.send_interval_seconds)
+
+        retry_at = 0.0
 
         while self.running:
+            flush_target = self.flush_completed
             try:
-                # 현재 로그 카운트 출력
+                with self.send_condition:
+                    if not self.has_new_logs and self.running:
+                        self.send_condition.wait(timeout=self.flush_interval_seconds)
+                    self.has_new_logs = False
+                    flush_target = self.flush_requested
+
+                if not self.running:
+                    break
+
+                # 전송 실패 후 재시도 대기 중이면 건너뜀 (flush_pending의 즉시 전송 요청은 예외)
+                if flush_target == self.flush_completed and time.monotonic() < retry_at:
+                    continue
+
                 pending_count = self.count_pending_logs()
                 total_pending = sum(pending_count.values())
-                if total_pending > 0:
-                    print(f"[INFO] 미전송 로그 {total_pending}개 처리 시작 - GPS: {pending_count['gps']}, 전원: {pending_count['power']}, 지오펜스: {pending_count['geofence']}개")
+                if total_pending == 0:
+                    continue
+
+                logger.info("미전송 로그 %s개 처리 시작 - GPS: %s, 전원: %s, 지오펜스: %s개", total_pending, pending_count['gps'], pending_count['power'], pending_count['geofence'])
 
                 # 미전송 로그 처리
-                self.process_pending_logs()
-
-                # 처리 후 카운트 다시 확인
-                after_count = self.count_pending_logs()
-                after_total = sum(after_count.values())
-                if total_pending > 0:
-                    print(f"[INFO] 로그 전송 후 남은 로그: {after_total}개")
-                    if after_total < total_pending:
-                        print(f"[SUCCESS] {total_pending - after_total}개의 로그가 성공적으로 전송됨")
-                    else:
-                        print(f"[WARNING] 모든 로그 전송 실패 또는 새 로그 추가됨")
+                failed_count = self.process_pending_logs()
 
                 # 시간 기록
                 self.last_connection_attempt = time.strftime("%Y-%m-%d %H:%M:%S")
 
-                # 다음 전송까지 대기
-                print(f"[INFO] 다음 로그 전송까지 {self.send_interval_seconds}초 대기...")
-                time.sleep(self.send_interval_seconds)
+                if failed_count > 0:
+                    retry_at = time.monotonic() + self.send_interval_seconds
+                    logger.warning("%s개의 로그 전송 실패 - %s초 후 재시도합니다", failed_count, self.send_interval_seconds)
+                else:
+                    logger.info("%s개의 로그가 성공적으로 전송됨", total_pending)
             except Exception as e:
-                print(f"[ERROR] 백그라운드 로그 전송 중 예외 발생: {str(e)}")
-                import traceback
-                print(traceback.format_exc())
-                time.sleep(self.send_interval_seconds)
-
-        print("[INFO] 백그라운드 로그 전송 스레드가 종료되었습니다.")
+                logger.error("백그라운드 로그 전송 중 예외 발생: %s", str(e), exc_info=True)
+                retry_at = time.monotonic() + self.send_interval_seconds
+            finally:
+                # 이번 회차 전에 들어온 즉시 전송 요청을 완료 처리하고 기다리는 호출자를 깨움
+                if flush_target != self.flush_completed:
+                    with self.send_condition:
+                        self.flush_completed = flush_target
+                        self.send_condition.notify_all()
+
+        logger.info("백그라운드 로그 전송 스레드가 종료되었습니다.")
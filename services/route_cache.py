@@ -0,0 +1,150 @@
+"""
+카카오 경로 캐시
+출발지/목적지 좌표별로 카카오 모빌리티 API 응답을 메모리와 파일에 보관하여
+재시작이나 추가 에뮬레이터 시작 시 동일 경로를 다시 요청하지 않도록 합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 캐시 유효 시간 (초) - 기본 24시간
+ROUTE_CACHE_TTL_SECONDS = 24 * 60 * 60
+# 좌표 반올림 자릿수 (소수점 5자리 ≈ 1m)
+ROUTE_KEY_PRECISION = 5
+# 보관할 최대 경로 수 (초과 시 가장 오래 저장된 경로부터 제거)
+ROUTE_CACHE_MAX_ENTRIES = 256
+
+
+class RouteCache:
+    """출발지/목적지 좌표를 키로 카카오 경로 응답을 보관하는 캐시"""
+
+    def __init__(self, cache_path: Optional[str] = None, ttl_seconds: int = ROUTE_CACHE_TTL_SECONDS,
+                 max_entries: int = ROUTE_CACHE_MAX_ENTRIES):
+        """
+        경로 캐시 초기화
+
+        Args:
+            cache_path: 캐시 파일 경로 (기본값: 환경 변수 ROUTE_CACHE_PATH 또는 .route_cache.json)
+            ttl_seconds: 캐시 유효 시간 (초)
+            max_entries: 보관할 최대 경로 수
+        """
+        self.cache_path = cache_path or os.environ.get("ROUTE_CACHE_PATH", ".route_cache.json")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        # 키 문자열 -> {"saved_at": epoch 초, "route": 카카오 응답}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    @staticmethod
+    def make_key(start: Tuple[float, float], end: Tuple[float, float]) -> str:
+        """
+        출발지/목적지 좌표로 캐시 키 생성
+
+        Args:
+            start: 출발 지점의 (위도, 경도)
+            end: 도착 지점의 (위도, 경도)
+
+        Returns:
+            str: 캐시 키
+        """
+        return ",".join(f"{round(float(value), ROUTE_KEY_PRECISION):.{ROUTE_KEY_PRECISION}f}"
+                        for value in (start[0], start[1], end[0], end[1]))
+
+    def get(self, start: Tuple[float, float], end: Tuple[float, float]) -> Optional[Dict]:
+        """
+        캐시된 경로 응답 조회
+
+        Args:
+            start: 출발 지점의 (위도, 경도)
+            end: 도착 지점의 (위도, 경도)
+
+        Returns:
+            Optional[Dict]: 유효한 캐시가 있으면 카카오 응답, 없으면 None
+        """
+        key = self.make_key(start, end)
+        with self.lock:
+            entry = self.entries.get(key)
+            if not entry:
+                return None
+            if time.time() - entry.get("saved_at", 0) > self.ttl_seconds:
+                del self.entries[key]
+                return None
+            return entry.get("route")
+
+    def put(self, start: Tuple[float, float], end: Tuple[float, float], route_data: Dict) -> None:
+        """
+        경로 응답을 캐시에 저장하고 파일에 기록
+
+        Args:
+            start: 출발 지점의 (위도, 경도)
+            end: 도착 지점의 (위도, 경도)
+            route_data: 카카오 API 응답
+        """
+        key = self.make_key(start, end)
+        with self.lock:
+            self.entries[key] = {"saved_at": time.time(), "route": route_data}
+            self._prune()
+            self._save()
+
+    def _prune(self) -> None:
+        """만료된 경로를 제거하고 최대 개수를 넘으면 오래된 경로부터 제거 (호출 측에서 락을 보유해야 함)"""
+        expire_before = time.time() - self.ttl_seconds
+        self.entries = {
+            key: entry for key, entry in self.entries.items()
+            if isinstance(entry, dict) and entry.get("saved_at", 0) >= expire_before
+        }
+        if len(self.entries) > self.max_entries:
+            newest = sorted(self.entries.items(), key=lambda item: item[1].get("saved_at", 0))[-self.max_entries:]
+            self.entries = dict(newest)
+
+    def _load(self) -> None:
+        """캐시 파일에서 저장된 경로 불러오기 (파일이 없거나 손상된 경우 빈 캐시로 시작)"""
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self.entries = entries
+                self._prune()
+                logger.info("경로 캐시 로드: %s개 경로 (%s)", len(self.entries), self.cache_path)
+        except Exception as e:
+            logger.warning("경로 캐시 파일 읽기 실패: %s", str(e))
+
+    def _save(self) -> None:
+        """현재 캐시를 파일에 기록 (호출 측에서 락을 보유해야 함)"""
+        try:
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning("경로 캐시 파일 저장 실패: %s", str(e))
+
+
+# 싱글톤 인스턴스 (처음 사용할 때 생성)
+_route_cache: Optional[RouteCache] = None
+_route_cache_lock = threading.Lock()
+
+
+def get_route_cache() -> RouteCache:
+    """
+    경로 캐시 싱글톤 반환 (최초 호출 시 생성)
+    모듈을 import하는 것만으로 캐시 파일을 읽지 않도록 지연 생성합니다.
+
+    Returns:
+        RouteCache: 경로 캐시 싱글톤
+    """
+    global _route_cache
+    if _route_cache is None:
+        with _route_cache_lock:
+            if _route_cache is None:
+                _route_cache = RouteCache()
+    return _route_cache
@@ -57,7 +57,7 @@ def test_emulator():
 
     # Test 4: Retrieve pending logs
     print("\n테스트 4: 대기 중인 로그 검색 중...")
-    pending_logs = data_generator.get_unsent_logs(test_mdn)
+    pending_logs = data_generator.get_unsent_logs_list(test_mdn)
 
     if pending_logs and len(pending_logs) > 0:
         print(f"✓ {len(pending_logs)}개의 대기 중인 로그를 검색했습니다")